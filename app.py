@@ -1,11 +1,11 @@
 """Streamlit web UI for resume tailoring."""
+import asyncio
+import json
+
 import streamlit as st
-import yaml
 from pathlib import Path
-import tempfile
-from datetime import datetime
-import shutil
 
+from src.cache import load_resume_cached
 from src.models.resume import ResumeData
 from src.services.claude_service import ClaudeService, ClaudeAPIError
 from src.services.latex_service import LaTeXService
@@ -38,15 +38,37 @@ def init_services():
     claude_service = ClaudeService()
     latex_service = LaTeXService()
     optimizer = PageOptimizer(latex_service, claude_service)
-    return settings, claude_service, latex_service, optimizer
+    # Resolve (and if needed create) Downloads once per session instead
+    # of stat()ing it on every rerun
+    downloads_folder = get_downloads_folder()
+    return settings, claude_service, latex_service, optimizer, downloads_folder
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_tailor(resume_json: str, jd: str, max_bullets: int, max_projects: int, model: str) -> dict:
+    """
+    Tailor the resume via Claude, cached on (resume, JD, options, model).
+
+    Re-running the app with the same inputs returns the cached result
+    instead of repeating the ~9s API call. The model name is part of the
+    key so switching models in .env invalidates old entries.
+    """
+    _, claude_service, _, _, _ = init_services()
+    tailored = claude_service.tailor_resume(
+        ResumeData.from_dict(json.loads(resume_json)),
+        jd,
+        max_bullets_per_job=max_bullets,
+        max_projects=max_projects
+    )
+    return tailored.to_dict()
 
 
 try:
-    settings, claude_service, latex_service, optimizer = init_services()
+    settings, claude_service, latex_service, optimizer, downloads_folder = init_services()
 
     # Check if LaTeX is installed
     if not latex_service.check_latex_installed():
-        st.error("⚠️ LaTeX (pdflatex) is not installed! Please install MacTeX or BasicTeX first.")
+        st.error("⚠️ No TeX engine (tectonic or pdflatex) is installed! Please install MacTeX or BasicTeX first.")
         st.stop()
 
     # Load resume data
@@ -56,9 +78,7 @@ try:
         st.info("Run `python -m src.main init` to create a template.")
         st.stop()
 
-    with open(resume_path, 'r', encoding='utf-8') as f:
-        resume_dict = yaml.safe_load(f)
-    resume_data = ResumeData.from_dict(resume_dict)
+    resume_data = load_resume_cached(resume_path)
 
     st.success(f"✅ Loaded resume for **{resume_data.personal_info.name}**")
 
@@ -97,12 +117,15 @@ with col2:
                     st.info("🤖 Tailoring resume with Claude AI...")
                 progress_placeholder.progress(0.2)
 
-                # Tailor resume
-                tailored_data = claude_service.tailor_resume(
-                    resume_data,
-                    job_description,
-                    max_bullets_per_job=max_bullets,
-                    max_projects=max_projects
+                # Tailor resume (cached across reruns with identical inputs)
+                tailored_data = ResumeData.from_dict(
+                    _cached_tailor(
+                        json.dumps(resume_data.to_dict(), sort_keys=True),
+                        job_description,
+                        max_bullets,
+                        max_projects,
+                        settings.claude_model
+                    )
                 )
 
                 progress_placeholder.progress(0.5)
@@ -122,26 +145,23 @@ with col2:
                         st.info("📄 Generating and optimizing PDF (may take 30-60 seconds)...")
                     progress_placeholder.progress(0.6)
 
-                    tailored_data, pdf_path = optimizer.optimize_to_one_page(
-                        tailored_data,
-                        output_name,
-                        max_iterations=5,
-                        verbose=False
+                    tailored_data, pdf_path = asyncio.run(
+                        optimizer.optimize_to_one_page_async(
+                            tailored_data,
+                            output_name,
+                            max_iterations=5,
+                            verbose=False
+                        )
                     )
                     page_count = latex_service.count_pages(pdf_path)
 
                 progress_placeholder.progress(1.0)
 
-                # Move to Downloads folder (don't keep in project)
-                downloads_folder = get_downloads_folder()
+                # Publish to Downloads folder; export_pdf replaces any
+                # existing file, preventing (1), (2) suffixes
                 final_filename = "Aneesh_Saba_Resume.pdf"
                 downloads_path = downloads_folder / final_filename
-
-                # Delete existing file to prevent (1), (2) suffixes
-                if downloads_path.exists():
-                    downloads_path.unlink()
-
-                shutil.move(str(pdf_path), str(downloads_path))
+                latex_service.export_pdf(pdf_path, downloads_path)
 
                 # Success!
                 with status_placeholder.container():
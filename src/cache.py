@@ -0,0 +1,120 @@
+"""Caching helpers: parsed resume sidecar and Claude response cache."""
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from src.models.resume import ResumeData
+
+try:
+    # libyaml-backed parser, 5-10x faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import diskcache
+except ImportError:
+    # Persistence is optional; without it the response cache still
+    # works within a single process
+    diskcache = None
+
+
+# User-local cache directory, shared across CLI invocations
+CACHE_DIR = Path.home() / ".cache" / "resume-tailor"
+
+
+class ResponseCache:
+    """
+    Exact-match cache for Claude responses.
+
+    A plain dict serves repeat lookups within the process; a diskcache
+    backend (when installed) persists entries across CLI invocations.
+    Both layers store the response as a JSON string, keyed by a SHA256
+    digest of every input that influences the output.
+    """
+
+    def __init__(self, directory: Path):
+        self._memory: dict[str, str] = {}
+        self._disk = None
+        if diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(str(directory))
+            except OSError:
+                pass
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Derive a cache key from the request parameters."""
+        joined = "\x1f".join(str(p) for p in parts)
+        return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response JSON, or None on a miss."""
+        value = self._memory.get(key)
+        if value is None and self._disk is not None:
+            try:
+                value = self._disk.get(key)
+            except Exception:
+                value = None
+            if value is not None:
+                self._memory[key] = value
+        return value
+
+    def set(self, key: str, value: str, expire: int = 86400) -> None:
+        """Store a response JSON under the given key."""
+        self._memory[key] = value
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, expire=expire)
+            except Exception:
+                pass
+
+
+def load_resume_cached(path: Path) -> ResumeData:
+    """
+    Load and validate the resume YAML, with a pickle sidecar fast path.
+
+    Every CLI command re-parses the YAML and re-runs all pydantic
+    validators on an unchanged file. The parsed ResumeData is cached to
+    a sidecar pickle keyed on the source file's (mtime_ns, size); on a
+    hit the YAML parse and validation are skipped entirely.
+
+    Args:
+        path: Path to the resume source YAML file
+
+    Returns:
+        Validated resume data
+
+    Raises:
+        ValidationError: If the resume data is invalid
+        OSError: If the resume file cannot be read
+    """
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cache_file = CACHE_DIR / "resume.pkl"
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == key and isinstance(cached_data, ResumeData):
+            return cached_data
+    except Exception:
+        # Missing, stale, or unreadable sidecar - fall through to a
+        # full parse; the cache is purely an optimization
+        pass
+
+    with open(path, 'r', encoding='utf-8') as f:
+        resume_dict = yaml.load(f, Loader=YamlLoader)
+    resume_data = ResumeData.from_dict(resume_dict)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((key, resume_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return resume_data
@@ -16,6 +16,10 @@ class Settings(BaseSettings):
         description="Claude model to use for resume tailoring"
     )
     max_tokens: int = Field(default=4096, description="Maximum tokens for API calls")
+    temperature: float = Field(
+        default=0.0,
+        description="Sampling temperature; 0 keeps outputs deterministic and cacheable"
+    )
 
     # Project Paths
     project_root: Path = Field(
@@ -38,6 +42,11 @@ class Settings(BaseSettings):
         """Templates directory path."""
         return self.project_root / "src" / "templates"
 
+    @property
+    def cache_dir(self) -> Path:
+        """User-local cache directory shared across invocations."""
+        return Path.home() / ".cache" / "resume-tailor"
+
     @property
     def resume_source_path(self) -> Path:
         """Resume source YAML file path."""
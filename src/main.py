@@ -1,13 +1,15 @@
 """Main CLI application for resume tailoring."""
+import asyncio
 import sys
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 
 import click
-import yaml
+import orjson
 from pydantic import ValidationError
 
+from src.cache import load_resume_cached
 from src.config import get_settings
 from src.models.resume import ResumeData
 from src.services.claude_service import ClaudeService, ClaudeAPIError
@@ -87,9 +89,7 @@ def tailor(job_description, output, no_optimize, preview):
             sys.exit(1)
 
         try:
-            with open(resume_path, 'r', encoding='utf-8') as f:
-                resume_dict = yaml.safe_load(f)
-            resume_data = ResumeData.from_dict(resume_dict)
+            resume_data = load_resume_cached(resume_path)
             click.echo(f"  Loaded resume for {resume_data.personal_info.name}")
         except ValidationError as e:
             click.echo(click.style(f"Error: Invalid resume data format", fg="red"))
@@ -105,7 +105,7 @@ def tailor(job_description, output, no_optimize, preview):
 
         # Check if LaTeX is installed
         if not latex_service.check_latex_installed() and not preview:
-            click.echo(click.style("\nError: LaTeX (pdflatex) is not installed!", fg="red"))
+            click.echo(click.style("\nError: No TeX engine (tectonic or pdflatex) is installed!", fg="red"))
             click.echo("\nTo install LaTeX on macOS:")
             click.echo("  brew install --cask mactex")
             click.echo("\nOr for a smaller installation:")
@@ -119,12 +119,26 @@ def tailor(job_description, output, no_optimize, preview):
         click.echo(click.style("\nTailoring resume with Claude API...", fg="blue"))
         click.echo("  (This may take 10-30 seconds)")
 
+        # As soon as the streamed response completes, start warming up
+        # the LaTeX pipeline in the background so template compilation
+        # and the preamble format dump overlap the stream drain
+        warmup_thread = None
+
+        def _start_latex_warmup(data):
+            nonlocal warmup_thread
+            if not preview:
+                warmup_thread = threading.Thread(
+                    target=latex_service.warm_up, args=(data,), daemon=True
+                )
+                warmup_thread.start()
+
         try:
-            tailored_data = claude_service.tailor_resume(
+            tailored_data = claude_service.tailor_resume_stream(
                 resume_data,
                 jd_text,
                 max_bullets_per_job=6,
-                max_projects=2
+                max_projects=2,
+                on_complete=_start_latex_warmup
             )
             click.echo(click.style("  ✓ Resume tailored successfully!", fg="green"))
         except ClaudeAPIError as e:
@@ -138,10 +152,17 @@ def tailor(job_description, output, no_optimize, preview):
         # Preview mode - just show the tailored data
         if preview:
             click.echo(click.style("\n=== Tailored Resume Preview ===", fg="cyan"))
-            click.echo(yaml.dump(tailored_data.to_dict(), default_flow_style=False))
+            # Pretty JSON via orjson: the preview is for inspection, not
+            # for round-tripping back into YAML, and the Rust serializer
+            # beats PyYAML's emitter by an order of magnitude
+            click.echo(orjson.dumps(tailored_data.to_dict(), option=orjson.OPT_INDENT_2).decode())
             click.echo(click.style("\nPreview complete. Use without --preview to generate PDF.", fg="blue"))
             return
 
+        # Let the LaTeX warm-up finish before compiling for real
+        if warmup_thread is not None:
+            warmup_thread.join()
+
         # Generate output filename
         if output:
             output_name = output
@@ -165,25 +186,23 @@ def tailor(job_description, output, no_optimize, preview):
             optimizer = PageOptimizer(latex_service, claude_service)
 
             try:
-                optimized_data, pdf_path = optimizer.optimize_to_one_page(
-                    tailored_data,
-                    output_name,
-                    max_iterations=5,
-                    verbose=True
+                optimized_data, pdf_path = asyncio.run(
+                    optimizer.optimize_to_one_page_async(
+                        tailored_data,
+                        output_name,
+                        max_iterations=5,
+                        verbose=True
+                    )
                 )
             except OptimizationError as e:
                 click.echo(click.style(f"\nOptimization error: {e}", fg="red"))
                 sys.exit(1)
 
-        # Move PDF to Downloads folder
+        # Publish PDF to Downloads folder; export_pdf replaces any
+        # existing file, preventing (1), (2) suffixes
         downloads_folder = get_downloads_folder()
         downloads_path = downloads_folder / f"{output_name}.pdf"
-
-        # Delete existing file to prevent (1), (2) suffixes
-        if downloads_path.exists():
-            downloads_path.unlink()
-
-        shutil.move(str(pdf_path), str(downloads_path))
+        latex_service.export_pdf(pdf_path, downloads_path)
 
         # Success!
         click.echo(click.style("\n✓ Resume generated successfully!", fg="green", bold=True))
@@ -210,56 +229,67 @@ def check():
     """Check if all dependencies are properly configured."""
     click.echo(click.style("Checking configuration...\n", fg="blue", bold=True))
 
-    all_good = True
-
-    # Check resume file
     settings = get_settings()
     resume_path = settings.resume_source_path
 
-    if resume_path.exists():
-        click.echo(click.style("✓", fg="green") + f" Resume file found: {resume_path}")
+    ok_mark = click.style("✓", fg="green")
+    bad_mark = click.style("✗", fg="red")
+
+    def check_resume():
+        if not resume_path.exists():
+            return False, [
+                bad_mark + f" Resume file not found: {resume_path}",
+                "  Run 'python -m src.main init' to create one"
+            ]
+        lines = [ok_mark + f" Resume file found: {resume_path}"]
         try:
-            with open(resume_path, 'r', encoding='utf-8') as f:
-                resume_dict = yaml.safe_load(f)
-            ResumeData.from_dict(resume_dict)
-            click.echo(click.style("✓", fg="green") + " Resume data is valid")
+            load_resume_cached(resume_path)
+            lines.append(ok_mark + " Resume data is valid")
+            return True, lines
         except Exception as e:
-            click.echo(click.style("✗", fg="red") + f" Resume data is invalid: {e}")
-            all_good = False
-    else:
-        click.echo(click.style("✗", fg="red") + f" Resume file not found: {resume_path}")
-        click.echo("  Run 'python -m src.main init' to create one")
-        all_good = False
-
-    # Check .env file
-    env_path = settings.project_root / ".env"
-    if env_path.exists():
-        click.echo(click.style("✓", fg="green") + " .env file found")
-    else:
-        click.echo(click.style("✗", fg="red") + " .env file not found")
-        click.echo("  Copy .env.example to .env and add your API key")
-        all_good = False
+            lines.append(bad_mark + f" Resume data is invalid: {e}")
+            return False, lines
+
+    def check_env_file():
+        env_path = settings.project_root / ".env"
+        if env_path.exists():
+            return True, [ok_mark + " .env file found"]
+        return False, [
+            bad_mark + " .env file not found",
+            "  Copy .env.example to .env and add your API key"
+        ]
+
+    def check_api_key():
+        try:
+            if settings.anthropic_api_key and settings.anthropic_api_key != "your_api_key_here":
+                return True, [ok_mark + " Anthropic API key is configured"]
+            return False, [
+                bad_mark + " Anthropic API key not set",
+                "  Add ANTHROPIC_API_KEY to your .env file"
+            ]
+        except Exception:
+            return False, [bad_mark + " Could not load API key from .env"]
+
+    def check_latex():
+        engine = LaTeXService.installed_engine()
+        if engine is not None:
+            return True, [ok_mark + f" TeX engine found: {engine}"]
+        return False, [
+            bad_mark + " No TeX engine (tectonic or pdflatex) found",
+            "  Install with: brew install --cask mactex"
+        ]
+
+    # The probes are independent and I/O-bound (file stats, YAML parse,
+    # PATH lookup), so fan them out and report in a fixed order
+    probes = [check_resume, check_env_file, check_api_key, check_latex]
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        results = [future.result() for future in [pool.submit(p) for p in probes]]
 
-    # Check API key
-    try:
-        if settings.anthropic_api_key and settings.anthropic_api_key != "your_api_key_here":
-            click.echo(click.style("✓", fg="green") + " Anthropic API key is configured")
-        else:
-            click.echo(click.style("✗", fg="red") + " Anthropic API key not set")
-            click.echo("  Add ANTHROPIC_API_KEY to your .env file")
-            all_good = False
-    except Exception:
-        click.echo(click.style("✗", fg="red") + " Could not load API key from .env")
-        all_good = False
-
-    # Check LaTeX
-    latex_service = LaTeXService()
-    if latex_service.check_latex_installed():
-        click.echo(click.style("✓", fg="green") + " LaTeX (pdflatex) is installed")
-    else:
-        click.echo(click.style("✗", fg="red") + " LaTeX (pdflatex) not found")
-        click.echo("  Install with: brew install --cask mactex")
-        all_good = False
+    all_good = True
+    for passed, lines in results:
+        all_good = all_good and passed
+        for line in lines:
+            click.echo(line)
 
     # Summary
     click.echo()
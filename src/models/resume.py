@@ -1,25 +1,42 @@
 """Pydantic models for resume data structure."""
+import re
 from typing import List, Dict, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, Field, field_validator
+
+# Strips everything that is not a digit or common phone formatting;
+# precompiled because the validator runs on every from_dict call
+_PHONE_CLEAN_RE = re.compile(r'[^\d()\- +]')
+_PHONE_DIGIT_RE = re.compile(r'\d')
 
 
 class PersonalInfo(BaseModel):
     """Personal contact information."""
     name: str = Field(..., description="Full name")
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     phone: str = Field(..., description="Phone number")
     linkedin: Optional[str] = Field(None, description="LinkedIn profile URL")
     github: Optional[str] = Field(None, description="GitHub profile URL")
     location: Optional[str] = Field(None, description="City, State or location")
 
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Lightweight email sanity check."""
+        # Full RFC validation via EmailStr would pull in the
+        # email-validator import on every cold start; for a
+        # user-maintained resume file a shape check is enough
+        if '@' not in v or '.' not in v.split('@')[-1]:
+            raise ValueError("Email must look like user@domain.tld")
+        return v
+
     @field_validator('phone')
     @classmethod
     def validate_phone(cls, v: str) -> str:
         """Basic phone number validation."""
         # Remove common phone formatting characters
-        cleaned = ''.join(c for c in v if c.isdigit() or c in '()- +')
-        if len(cleaned) < 10:
+        cleaned = _PHONE_CLEAN_RE.sub('', v)
+        if len(_PHONE_DIGIT_RE.findall(cleaned)) < 10:
             raise ValueError("Phone number must have at least 10 digits")
         return v
 
@@ -101,7 +118,11 @@ class ResumeData(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for YAML serialization."""
-        return self.model_dump(exclude_none=True)
+        # Call the pydantic-core serializer directly: identical output to
+        # model_dump(exclude_none=True) without the Python-level wrapper,
+        # which matters because this runs on every preview, cache key,
+        # and optimizer iteration
+        return self.__pydantic_serializer__.to_python(self, exclude_none=True)
 
     @classmethod
     def from_dict(cls, data: dict) -> "ResumeData":
@@ -1,11 +1,15 @@
 """Claude API service for resume tailoring."""
+import asyncio
 import json
 import re
-from typing import Optional
+import time
+from typing import Callable, Optional
 
-from anthropic import Anthropic
+import orjson
+from anthropic import Anthropic, AsyncAnthropic
 from pydantic import ValidationError
 
+from src.cache import ResponseCache
 from src.config import get_settings
 from src.models.resume import ResumeData
 
@@ -15,16 +19,53 @@ class ClaudeAPIError(Exception):
     pass
 
 
-class ClaudeService:
-    """Service for interacting with Claude API to tailor resumes."""
+# Process-level client singletons. Streamlit's cache_resource is
+# per-session, so without these every session (and every code edit)
+# rebuilds the HTTP client and its TCP/TLS connection pool. The SDK's
+# default HTTP client already keeps connections alive between requests,
+# so no custom transport is injected - that would tie this module to
+# whichever HTTP library the installed SDK version happens to use.
+_client: Optional[Anthropic] = None
+_async_client: Optional[AsyncAnthropic] = None
 
-    TAILORING_PROMPT_TEMPLATE = """You are an expert resume writer and ATS optimization specialist. Your task is to tailor a resume to match a specific job description while maintaining factual accuracy.
+# Longest acceptable gap between bytes from the API. Passed per-request
+# on streaming calls only: httpx-style timeouts treat a bare number as
+# a per-phase limit (connect, read, write), so a stalled stream aborts
+# after this many seconds while an actively streaming response can run
+# as long as it needs. Non-streaming create() calls receive no bytes
+# until generation finishes - routinely well past 30s - so they keep
+# the SDK's default, which the SDK only substitutes with its own long
+# non-streaming timeout when the client timeout is left untouched.
+_STALL_TIMEOUT = 30.0
 
-Job Description:
-{job_description}
+# Compiled once at import; _extract_json runs on every API response
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _get_client() -> Anthropic:
+    """Get or create the shared synchronous Anthropic client."""
+    global _client
+    if _client is None:
+        _client = Anthropic(api_key=get_settings().anthropic_api_key)
+    return _client
+
+
+def _get_async_client() -> AsyncAnthropic:
+    """Get or create the shared asynchronous Anthropic client."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncAnthropic(api_key=get_settings().anthropic_api_key)
+    return _async_client
+
+
+class ClaudeService:
+    """Service for interacting with Claude API to tailor resumes."""
 
-Current Resume Data (in JSON format):
-{resume_json}
+    # Byte-identical across every call, so it is sent as a system block
+    # with cache_control and everything after the first call reads it
+    # from the server-side prompt cache. Anything variable (resume, job
+    # description, numeric limits) lives in the user message instead.
+    TAILORING_SYSTEM_TEMPLATE = """You are an expert resume writer and ATS optimization specialist. Your task is to tailor a resume to match a specific job description while maintaining factual accuracy.
 
 Instructions:
 1. Carefully analyze the job description for:
@@ -66,8 +107,7 @@ Instructions:
    - Maintain all factual details (dates, companies, degrees, etc.)
    - Keep the same overall structure
    - Include ALL work experiences from the original resume (do not remove any)
-   - Each experience entry should have {max_bullets_per_job} bullet points maximum
-   - Include maximum {max_projects} projects (prioritize most relevant)
+   - Respect the per-request limits on bullets per entry and project count
    - Each bullet point MUST fit on a single line - TARGET 75-95 characters (count ONLY text, not LaTeX markup)
    - Pack maximum information: action verb + metric + HOW you did it (method/technologies used)
    - ALWAYS use complete XYZ format: "Accomplished [X] as measured by [Y] by doing [Z]"
@@ -91,13 +131,174 @@ Instructions:
    - Do not include any explanation or commentary
    - Ensure all required fields are present
    - The JSON should be parseable by Python's json.loads()
+   - The object must validate against this JSON Schema: {resume_schema}"""
+
+    TAILORING_REQUEST_TEMPLATE = """Job Description:
+{job_description}
+
+Limits for this request:
+- Each experience entry should have {max_bullets_per_job} bullet points maximum
+- Include maximum {max_projects} projects (prioritize most relevant)
 
 Return the tailored resume data as valid JSON now:"""
 
+    REDUCTION_SYSTEM_PROMPT = """You are helping optimize a resume to fit on a target number of pages.
+
+Instructions:
+1. Reduce the content while preserving the most impactful information
+2. Strategies to use (in order of preference):
+   - Compress bullets to single lines (TARGET 75-95 chars of visible text to avoid wrapping) with XYZ format keeping all metrics
+   - ALWAYS use complete XYZ format: "Accomplished [X] as measured by [Y] by doing [Z]"
+   - NEVER omit the method/technology (the Z part) - it contains critical keywords
+   - CRITICAL: Add spaces around metrics and symbols (e.g., "3× at" not "3×at")
+   - Use shorter synonyms: "via" instead of "by doing", abbreviate naturally where possible
+   - Remove least impactful projects (keep top 2 most impressive)
+   - Reduce bullet points for OLDER positions only (keep 4-6 bullets for recent roles)
+   - Compress wording but preserve all technical details, numbers, and keywords
+   - Consolidate similar skills in the skills section
+   - For positions before 2023, keep fewer details
+
+3. Maintain:
+   - All factual accuracy
+   - Most impressive achievements and quantified results
+   - Recent and relevant experience in full detail
+   - Overall structure and formatting
+   - ALL keywords and technical terms - never remove technologies/tools mentioned
+   - BOLD ALL key terms using \\textbf{} - MUST use TWO backslashes (single \t becomes tab!)
+   - Bold technologies, frameworks, metrics, keywords, domain terms
+   - Example: \\textbf{MongoDB} or \\textbf{25%} - always TWO backslashes
+   - Compress wording but preserve every technical keyword
+
+4. Return ONLY valid JSON matching the input structure."""
+
+    REDUCTION_REQUEST_TEMPLATE = """The resume is currently {current_pages} pages long and must fit on {target_pages} page(s).
+
+Return the optimized resume data as valid JSON now:"""
+
     def __init__(self):
         """Initialize the Claude service."""
         self.settings = get_settings()
-        self.client = Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = _get_client()
+        self.async_client = _get_async_client()
+        # The schema walk is not free and the result never changes, so
+        # compute it once instead of on every prompt build
+        self._schema_str = orjson.dumps(ResumeData.model_json_schema()).decode()
+        # System blocks are built once so they stay byte-identical
+        # between calls - a requirement for prompt cache hits
+        self._tailoring_system = [{
+            "type": "text",
+            "text": self.TAILORING_SYSTEM_TEMPLATE.format(
+                resume_schema=self._schema_str
+            ),
+            "cache_control": {"type": "ephemeral"}
+        }]
+        self._reduction_system = [{
+            "type": "text",
+            "text": self.REDUCTION_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+        self._response_cache = ResponseCache(self.settings.cache_dir / "responses")
+        # Last (instance, JSON) pair handed to _resume_json
+        self._resume_json_memo: Optional[tuple[ResumeData, str]] = None
+
+    def _resume_json(self, resume_data: ResumeData) -> str:
+        """
+        Serialize the resume to indented JSON, memoized per instance.
+
+        A tailor -> probe -> reduce chain serializes the same object
+        several times (prompt block plus cache key each call); the memo
+        keeps the last instance and its JSON so repeats cost a pointer
+        comparison. Identity keying is sound because reductions always
+        produce new instances rather than mutating their input.
+        """
+        memo = self._resume_json_memo
+        if memo is not None and memo[0] is resume_data:
+            return memo[1]
+        blob = orjson.dumps(
+            resume_data.to_dict(), option=orjson.OPT_INDENT_2
+        ).decode()
+        self._resume_json_memo = (resume_data, blob)
+        return blob
+
+    def _cache_key(self, *parts) -> Optional[str]:
+        """
+        Cache key for a request, or None when caching is unsafe.
+
+        Responses are only reusable when sampling is deterministic, so
+        any non-zero temperature disables the response cache entirely.
+        """
+        if self.settings.temperature != 0:
+            return None
+        return ResponseCache.key(self.settings.claude_model, *parts)
+
+    def _stream_text(self, **params) -> str:
+        """
+        Collect a complete response via the streaming API.
+
+        The per-request read timeout is the dead-man switch here: a
+        connection that stops delivering for longer than _STALL_TIMEOUT
+        raises from the iteration itself instead of blocking forever,
+        and a stream that merely slows down is unaffected.
+        """
+        chunks: list[str] = []
+        with self.client.messages.stream(timeout=_STALL_TIMEOUT, **params) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+        return "".join(chunks)
+
+    def _resume_block(self, resume_data: ResumeData) -> dict:
+        """
+        Build the cacheable content block carrying the resume JSON.
+
+        Together with the cached system prompt this forms a stable
+        prefix, so only the short request text after it is re-processed
+        on repeated calls against the same resume.
+        """
+        return {
+            "type": "text",
+            "text": "Current Resume Data (in JSON format):\n"
+                    + self._resume_json(resume_data),
+            "cache_control": {"type": "ephemeral"}
+        }
+
+    def _build_tailoring_content(
+        self,
+        resume_data: ResumeData,
+        job_description: str,
+        max_bullets_per_job: int,
+        max_projects: int
+    ) -> list[dict]:
+        """Build the tailoring user-message content blocks."""
+        request_text = self.TAILORING_REQUEST_TEMPLATE.format(
+            job_description=job_description,
+            max_bullets_per_job=max_bullets_per_job,
+            max_projects=max_projects
+        )
+        return [
+            self._resume_block(resume_data),
+            {"type": "text", "text": request_text}
+        ]
+
+    def _parse_resume_response(self, response_text: str) -> ResumeData:
+        """
+        Parse and validate a resume JSON response from Claude.
+
+        Args:
+            response_text: Raw response text from Claude
+
+        Returns:
+            Validated resume data
+
+        Raises:
+            ClaudeAPIError: If JSON cannot be parsed or data is invalid
+        """
+        tailored_json = self._extract_json(response_text)
+        try:
+            return ResumeData.from_dict(tailored_json)
+        except ValidationError as e:
+            raise ClaudeAPIError(
+                f"Claude returned invalid resume data structure: {e}"
+            )
 
     def tailor_resume(
         self,
@@ -121,47 +322,305 @@ Return the tailored resume data as valid JSON now:"""
         Raises:
             ClaudeAPIError: If API call fails or response is invalid
         """
-        # Prepare the prompt
-        resume_json = json.dumps(resume_data.to_dict(), indent=2)
-        prompt = self.TAILORING_PROMPT_TEMPLATE.format(
-            job_description=job_description,
-            resume_json=resume_json,
-            max_bullets_per_job=max_bullets_per_job,
-            max_projects=max_projects
+        cache_key = self._cache_key(
+            "tailor",
+            self._resume_json(resume_data),
+            job_description,
+            max_bullets_per_job,
+            max_projects
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return ResumeData.from_dict(orjson.loads(cached))
+
+        content = self._build_tailoring_content(
+            resume_data, job_description, max_bullets_per_job, max_projects
         )
 
         try:
             # Call Claude API
-            message = self.client.messages.create(
+            response_text = self._stream_text(
+                model=self.settings.claude_model,
+                max_tokens=self.settings.max_tokens,
+                temperature=self.settings.temperature,
+                system=self._tailoring_system,
+                messages=[{"role": "user", "content": content}]
+            )
+
+            tailored = self._parse_resume_response(response_text)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, orjson.dumps(tailored.to_dict()).decode())
+            return tailored
+
+        except Exception as e:
+            if isinstance(e, ClaudeAPIError):
+                raise
+            raise ClaudeAPIError(f"Failed to tailor resume with Claude API: {e}")
+
+    def tailor_resume_stream(
+        self,
+        resume_data: ResumeData,
+        job_description: str,
+        max_bullets_per_job: int = 3,
+        max_projects: int = 3,
+        on_complete: Optional[Callable[[ResumeData], None]] = None
+    ) -> ResumeData:
+        """
+        Tailor the resume via a streaming Claude response.
+
+        The response JSON is parsed opportunistically as chunks arrive;
+        as soon as the top-level object is complete, on_complete fires
+        with the validated data so downstream work (e.g. warming up the
+        LaTeX pipeline) can start before the stream finishes draining.
+
+        Args:
+            resume_data: Original resume data
+            job_description: Target job description text
+            max_bullets_per_job: Maximum bullet points per job
+            max_projects: Maximum number of projects to include
+            on_complete: Optional callback invoked once with the parsed
+                data as soon as it is available
+
+        Returns:
+            Tailored resume data
+
+        Raises:
+            ClaudeAPIError: If API call fails or response is invalid
+        """
+        # Same key as tailor_resume, so either entry point can serve a
+        # repeat of the other's request without a round-trip
+        cache_key = self._cache_key(
+            "tailor",
+            self._resume_json(resume_data),
+            job_description,
+            max_bullets_per_job,
+            max_projects
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                tailored = ResumeData.from_dict(orjson.loads(cached))
+                if on_complete is not None:
+                    on_complete(tailored)
+                return tailored
+
+        content = self._build_tailoring_content(
+            resume_data, job_description, max_bullets_per_job, max_projects
+        )
+
+        chunks: list[str] = []
+        parsed: Optional[ResumeData] = None
+
+        try:
+            with self.client.messages.stream(
+                model=self.settings.claude_model,
+                max_tokens=self.settings.max_tokens,
+                temperature=self.settings.temperature,
+                system=self._tailoring_system,
+                messages=[{"role": "user", "content": content}],
+                timeout=_STALL_TIMEOUT
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    # Only attempt a parse when a closing brace arrived -
+                    # the object cannot have completed otherwise
+                    if parsed is None and "}" in text:
+                        parsed = self._try_parse_partial("".join(chunks))
+                        if parsed is not None and on_complete is not None:
+                            on_complete(parsed)
+
+            tailored = parsed
+            if tailored is None:
+                tailored = self._parse_resume_response("".join(chunks))
+            if cache_key is not None:
+                self._response_cache.set(
+                    cache_key, orjson.dumps(tailored.to_dict()).decode()
+                )
+            return tailored
+
+        except Exception as e:
+            if isinstance(e, ClaudeAPIError):
+                raise
+            raise ClaudeAPIError(f"Failed to tailor resume with Claude API: {e}")
+
+    def _try_parse_partial(self, text: str) -> Optional[ResumeData]:
+        """
+        Attempt to parse a resume object from a partially streamed response.
+
+        Args:
+            text: Response text accumulated so far
+
+        Returns:
+            Validated resume data if a complete, valid object is present,
+            otherwise None
+        """
+        start = text.find('{')
+        if start == -1:
+            return None
+
+        try:
+            obj, _ = json.JSONDecoder().raw_decode(text[start:])
+        except json.JSONDecodeError:
+            return None
+
+        try:
+            return ResumeData.from_dict(obj)
+        except ValidationError:
+            return None
+
+    async def tailor_resume_async(
+        self,
+        resume_data: ResumeData,
+        job_description: str,
+        max_bullets_per_job: int = 3,
+        max_projects: int = 3
+    ) -> ResumeData:
+        """
+        Async variant of tailor_resume for use with asyncio-based callers.
+
+        Allows the optimizer to overlap Claude API latency with LaTeX
+        compilation instead of paying for both sequentially.
+
+        Args:
+            resume_data: Original resume data
+            job_description: Target job description text
+            max_bullets_per_job: Maximum bullet points per job
+            max_projects: Maximum number of projects to include
+
+        Returns:
+            Tailored resume data
+
+        Raises:
+            ClaudeAPIError: If API call fails or response is invalid
+        """
+        content = self._build_tailoring_content(
+            resume_data, job_description, max_bullets_per_job, max_projects
+        )
+
+        try:
+            message = await self.async_client.messages.create(
                 model=self.settings.claude_model,
                 max_tokens=self.settings.max_tokens,
+                temperature=self.settings.temperature,
+                system=self._tailoring_system,
                 messages=[
                     {
                         "role": "user",
-                        "content": prompt
+                        "content": content
                     }
                 ]
             )
 
-            # Extract text response
             response_text = message.content[0].text
+            return self._parse_resume_response(response_text)
 
-            # Parse JSON from response
-            tailored_json = self._extract_json(response_text)
+        except Exception as e:
+            if isinstance(e, ClaudeAPIError):
+                raise
+            raise ClaudeAPIError(f"Failed to tailor resume with Claude API: {e}")
 
-            # Validate and return as ResumeData
-            try:
-                tailored_data = ResumeData.from_dict(tailored_json)
-                return tailored_data
-            except ValidationError as e:
-                raise ClaudeAPIError(
-                    f"Claude returned invalid resume data structure: {e}"
-                )
+    async def tailor_resume_many(
+        self,
+        resume_data: ResumeData,
+        job_descriptions: list[str],
+        max_bullets_per_job: int = 3,
+        max_projects: int = 3
+    ) -> list[ResumeData]:
+        """
+        Tailor one resume against several job descriptions concurrently.
+
+        All requests run as overlapping HTTP calls on the shared async
+        client, so wall-clock time is roughly one round-trip instead of
+        one per job description.
+
+        Args:
+            resume_data: Original resume data
+            job_descriptions: Target job description texts
+            max_bullets_per_job: Maximum bullet points per job
+            max_projects: Maximum number of projects to include
+
+        Returns:
+            Tailored resume data, in job_descriptions order
+
+        Raises:
+            ClaudeAPIError: If any API call fails or a response is invalid
+        """
+        return list(await asyncio.gather(*(
+            self.tailor_resume_async(
+                resume_data,
+                job_description,
+                max_bullets_per_job=max_bullets_per_job,
+                max_projects=max_projects
+            )
+            for job_description in job_descriptions
+        )))
+
+    def tailor_resume_batch(
+        self,
+        resume_data: ResumeData,
+        job_descriptions: list[str],
+        max_bullets_per_job: int = 3,
+        max_projects: int = 3,
+        poll_interval: float = 5.0
+    ) -> list[ResumeData]:
+        """
+        Tailor one resume against many job descriptions in a single batch.
+
+        The Message Batches API processes the items server-side at a
+        discount, and every item shares the cached system prompt and
+        resume block, so only each job description is fresh input.
+
+        Args:
+            resume_data: Original resume data
+            job_descriptions: Target job description texts
+            max_bullets_per_job: Maximum bullet points per job
+            max_projects: Maximum number of projects to include
+            poll_interval: Seconds between batch status polls
+
+        Returns:
+            Tailored resume data, in job_descriptions order
+
+        Raises:
+            ClaudeAPIError: If the batch fails or any item is invalid
+        """
+        requests = []
+        for i, job_description in enumerate(job_descriptions):
+            content = self._build_tailoring_content(
+                resume_data, job_description, max_bullets_per_job, max_projects
+            )
+            requests.append({
+                "custom_id": f"jd-{i}",
+                "params": {
+                    "model": self.settings.claude_model,
+                    "max_tokens": self.settings.max_tokens,
+                    "temperature": self.settings.temperature,
+                    "system": self._tailoring_system,
+                    "messages": [{"role": "user", "content": content}]
+                }
+            })
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            tailored: dict[str, ResumeData] = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    raise ClaudeAPIError(
+                        f"Batch item {entry.custom_id} {entry.result.type}"
+                    )
+                response_text = entry.result.message.content[0].text
+                tailored[entry.custom_id] = self._parse_resume_response(response_text)
+
+            return [tailored[f"jd-{i}"] for i in range(len(job_descriptions))]
 
         except Exception as e:
             if isinstance(e, ClaudeAPIError):
                 raise
-            raise ClaudeAPIError(f"Failed to tailor resume with Claude API: {e}")
+            raise ClaudeAPIError(f"Failed to tailor resume batch: {e}")
 
     def _extract_json(self, text: str) -> dict:
         """
@@ -176,31 +635,37 @@ Return the tailored resume data as valid JSON now:"""
         Raises:
             ClaudeAPIError: If JSON cannot be extracted or parsed
         """
-        # Try to find JSON in code blocks first
-        code_block_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        code_match = re.search(code_block_pattern, text, re.DOTALL)
+        # Fast path: under the strict system prompt the response is
+        # normally bare JSON
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+        # Decode the first complete object wherever it starts; this
+        # also covers fenced ```json blocks, and raw_decode stops at
+        # the closing brace instead of greedily scanning to the end
+        # like the old \{.*\} regex
+        start = text.find('{')
+        if start != -1:
+            try:
+                obj, _ = json.JSONDecoder().raw_decode(text, start)
+                return obj
+            except json.JSONDecodeError:
+                pass
 
+        # Last resort: a fenced block whose content needed trimming
+        code_match = _CODE_BLOCK_RE.search(text)
         if code_match:
-            json_str = code_match.group(1)
-        else:
-            # Try to find raw JSON object
-            json_pattern = r"\{.*\}"
-            json_match = re.search(json_pattern, text, re.DOTALL)
-
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                # Maybe the entire response is JSON
-                json_str = text.strip()
-
-        # Try to parse the JSON
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise ClaudeAPIError(
-                f"Failed to parse JSON from Claude response: {e}\n"
-                f"Response text:\n{text[:500]}..."
-            )
+            try:
+                return orjson.loads(code_match.group(1))
+            except orjson.JSONDecodeError:
+                pass
+
+        raise ClaudeAPIError(
+            f"Failed to parse JSON from Claude response\n"
+            f"Response text:\n{text[:500]}..."
+        )
 
     def suggest_content_reduction(
         self,
@@ -222,60 +687,228 @@ Return the tailored resume data as valid JSON now:"""
         Raises:
             ClaudeAPIError: If API call fails
         """
-        prompt = f"""You are helping optimize a resume that is currently {current_pages} pages long to fit on {target_pages} page(s).
+        cache_key = self._cache_key(
+            "reduce",
+            self._resume_json(resume_data),
+            current_pages,
+            target_pages
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return ResumeData.from_dict(orjson.loads(cached))
 
-Current Resume Data (in JSON format):
-{json.dumps(resume_data.to_dict(), indent=2)}
+        content = self._build_reduction_content(resume_data, current_pages, target_pages)
 
-Instructions:
-1. Reduce the content while preserving the most impactful information
-2. Strategies to use (in order of preference):
-   - Compress bullets to single lines (TARGET 75-95 chars of visible text to avoid wrapping) with XYZ format keeping all metrics
-   - ALWAYS use complete XYZ format: "Accomplished [X] as measured by [Y] by doing [Z]"
-   - NEVER omit the method/technology (the Z part) - it contains critical keywords
-   - CRITICAL: Add spaces around metrics and symbols (e.g., "3× at" not "3×at")
-   - Use shorter synonyms: "via" instead of "by doing", abbreviate naturally where possible
-   - Remove least impactful projects (keep top 2 most impressive)
-   - Reduce bullet points for OLDER positions only (keep 4-6 bullets for recent roles)
-   - Compress wording but preserve all technical details, numbers, and keywords
-   - Consolidate similar skills in the skills section
-   - For positions before 2023, keep fewer details
+        try:
+            response_text = self._stream_text(
+                model=self.settings.claude_model,
+                max_tokens=self.settings.max_tokens,
+                temperature=self.settings.temperature,
+                system=self._reduction_system,
+                messages=[{"role": "user", "content": content}]
+            )
 
-3. Maintain:
-   - All factual accuracy
-   - Most impressive achievements and quantified results
-   - Recent and relevant experience in full detail
-   - Overall structure and formatting
-   - ALL keywords and technical terms - never remove technologies/tools mentioned
-   - BOLD ALL key terms using \\textbf{{}} - MUST use TWO backslashes (single \t becomes tab!)
-   - Bold technologies, frameworks, metrics, keywords, domain terms
-   - Example: \\textbf{{MongoDB}} or \\textbf{{25%}} - always TWO backslashes
-   - Compress wording but preserve every technical keyword
+            reduced = self._parse_resume_response(response_text)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, orjson.dumps(reduced.to_dict()).decode())
+            return reduced
 
-4. Return ONLY valid JSON matching the input structure.
+        except Exception as e:
+            if isinstance(e, ClaudeAPIError):
+                raise
+            raise ClaudeAPIError(
+                f"Failed to get content reduction suggestions: {e}"
+            )
 
-Return the optimized resume data as valid JSON now:"""
+    async def suggest_content_reduction_async(
+        self,
+        resume_data: ResumeData,
+        current_pages: int,
+        target_pages: int = 1
+    ) -> ResumeData:
+        """
+        Async variant of suggest_content_reduction.
+
+        Lets the optimizer request the next reduction while a LaTeX
+        compile is still running.
+
+        Args:
+            resume_data: Current resume data
+            current_pages: Current number of pages
+            target_pages: Target number of pages (default: 1)
+
+        Returns:
+            Resume data with reduced content
+
+        Raises:
+            ClaudeAPIError: If API call fails
+        """
+        # Shares the sync method's key, so either variant serves repeats
+        # of the other
+        cache_key = self._cache_key(
+            "reduce",
+            self._resume_json(resume_data),
+            current_pages,
+            target_pages
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return ResumeData.from_dict(orjson.loads(cached))
+
+        content = self._build_reduction_content(resume_data, current_pages, target_pages)
 
         try:
-            message = self.client.messages.create(
+            message = await self.async_client.messages.create(
                 model=self.settings.claude_model,
                 max_tokens=self.settings.max_tokens,
-                messages=[{"role": "user", "content": prompt}]
+                temperature=self.settings.temperature,
+                system=self._reduction_system,
+                messages=[{"role": "user", "content": content}]
             )
 
             response_text = message.content[0].text
-            reduced_json = self._extract_json(response_text)
+            reduced = self._parse_resume_response(response_text)
+            if cache_key is not None:
+                self._response_cache.set(
+                    cache_key, orjson.dumps(reduced.to_dict()).decode()
+                )
+            return reduced
 
-            try:
-                return ResumeData.from_dict(reduced_json)
-            except ValidationError as e:
+        except Exception as e:
+            if isinstance(e, ClaudeAPIError):
+                raise
+            raise ClaudeAPIError(
+                f"Failed to get content reduction suggestions: {e}"
+            )
+
+    def suggest_content_reduction_levels(
+        self,
+        resume_data: ResumeData,
+        current_pages: int,
+        target_pages: int = 1,
+        levels: int = 3
+    ) -> list[ResumeData]:
+        """
+        Request several compression levels in a single Claude call.
+
+        Instead of paying one API round-trip per optimizer iteration,
+        ask for a ladder of progressively more aggressive reductions at
+        once; the caller can then cheaply compile the candidates locally
+        (e.g. by bisection) and keep the least aggressive one that fits.
+
+        Args:
+            resume_data: Current resume data
+            current_pages: Current number of pages
+            target_pages: Target number of pages (default: 1)
+            levels: Number of candidates to request (default: 3)
+
+        Returns:
+            Candidate resume data, ordered least to most aggressive
+
+        Raises:
+            ClaudeAPIError: If API call fails or no valid candidate is returned
+        """
+        if levels < 2:
+            raise ValueError("levels must be at least 2")
+
+        cache_key = self._cache_key(
+            "reduce-levels",
+            self._resume_json(resume_data),
+            current_pages,
+            target_pages,
+            levels
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return [ResumeData.from_dict(d) for d in orjson.loads(cached)]
+
+        rungs = ["- level_1: mild - compress wording only, keep all bullets and projects"]
+        for i in range(2, levels):
+            rungs.append(
+                f"- level_{i}: trim further than level_{i - 1} - "
+                "fewer bullets on older positions, drop the weakest remaining project"
+            )
+        rungs.append(
+            f"- level_{levels}: aggressive - minimum content that still covers every position"
+        )
+        rung_text = "\n".join(rungs)
+        shape = ", ".join(f'"level_{i}": <resume data>' for i in range(1, levels + 1))
+
+        levels_request = f"""The resume is currently {current_pages} pages long and must fit on {target_pages} page(s).
+
+For this request, instead of a single result, produce {levels} candidate reductions of increasing aggressiveness:
+{rung_text}
+
+Return ONLY a valid JSON object of the form:
+{{{shape}}}
+where each <resume data> matches the input structure exactly.
+
+Return the {levels} candidates as valid JSON now:"""
+
+        content = [
+            self._resume_block(resume_data),
+            {"type": "text", "text": levels_request}
+        ]
+
+        try:
+            response_text = self._stream_text(
+                model=self.settings.claude_model,
+                # Each full resume in the ladder needs its own room
+                max_tokens=self.settings.max_tokens * levels,
+                temperature=self.settings.temperature,
+                system=self._reduction_system,
+                messages=[{"role": "user", "content": content}]
+            )
+
+            levels_json = self._extract_json(response_text)
+
+            candidates = []
+            # Numeric sort: lexicographic would put level_10 before level_2
+            level_keys = sorted(
+                (k for k in levels_json if re.fullmatch(r"level_\d+", k)),
+                key=lambda k: int(k.rsplit("_", 1)[1])
+            )
+            for key in level_keys:
+                try:
+                    candidates.append(ResumeData.from_dict(levels_json[key]))
+                except ValidationError:
+                    continue
+
+            if not candidates:
                 raise ClaudeAPIError(
-                    f"Claude returned invalid resume data structure: {e}"
+                    "Claude returned no valid reduction candidates"
+                )
+            if cache_key is not None:
+                self._response_cache.set(
+                    cache_key,
+                    orjson.dumps([c.to_dict() for c in candidates]).decode()
                 )
+            return candidates
 
         except Exception as e:
             if isinstance(e, ClaudeAPIError):
                 raise
             raise ClaudeAPIError(
-                f"Failed to get content reduction suggestions: {e}"
+                f"Failed to get content reduction candidates: {e}"
             )
+
+    def _build_reduction_content(
+        self,
+        resume_data: ResumeData,
+        current_pages: int,
+        target_pages: int
+    ) -> list[dict]:
+        """Build the content reduction user-message content blocks."""
+        return [
+            self._resume_block(resume_data),
+            {
+                "type": "text",
+                "text": self.REDUCTION_REQUEST_TEMPLATE.format(
+                    current_pages=current_pages,
+                    target_pages=target_pages
+                )
+            }
+        ]
@@ -1,11 +1,17 @@
 """LaTeX template rendering and PDF compilation service."""
+import functools
+import hashlib
+import os
 import re
 import subprocess
+import tempfile
+import weakref
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Optional
 import shutil
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from pypdf import PdfReader
 
 from src.config import get_settings
@@ -17,9 +23,136 @@ class LaTeXCompilationError(Exception):
     pass
 
 
+# Matches \textbf{...}, \textit{...}, etc. with optional space before the
+# brace. Compiled once at import; _latex_escape runs per template field.
+_LATEX_CMD_RE = re.compile(r'(\\text(?:bf|it|tt|sc|sl|em))\s*\{([^}]*)\}')
+
+# Unicode characters that need math-mode or typographic LaTeX forms
+_UNICODE_MAP = {
+    '≈': r'$\approx$',        # Approximately equal
+    '±': r'$\pm$',            # Plus-minus
+    '×': r'$\times$',         # Multiplication
+    '÷': r'$\div$',           # Division
+    '≤': r'$\leq$',           # Less than or equal
+    '≥': r'$\geq$',           # Greater than or equal
+    '≠': r'$\neq$',           # Not equal
+    '→': r'$\rightarrow$',    # Right arrow
+    '←': r'$\leftarrow$',     # Left arrow
+    '−': r'$-$',              # Minus sign (different from hyphen)
+    '–': r'--',               # En dash
+    '—': r'---',              # Em dash
+    '“': r'``',          # Left double quote
+    '”': r"''",          # Right double quote
+    '‘': r'`',           # Left single quote
+    '’': r"'",           # Right single quote
+    '…': r'\ldots{}',         # Ellipsis
+}
+
+# Full escape map for plain text: Unicode forms plus LaTeX specials.
+# Applied in a single regex pass, so replacement ordering (backslash
+# first) and double-escaping are non-issues - each source character is
+# consumed exactly once and replacements are never rescanned.
+_ESCAPE_MAP = {
+    **_UNICODE_MAP,
+    '\\': r'\textbackslash{}',
+    '%': r'\%',
+    '$': r'\$',
+    '&': r'\&',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+}
+# Inside protected commands, $ stays literal for the math-mode Unicode
+# forms and braces/backslashes belong to the command markup itself
+_CMD_CONTENT_MAP = {
+    **_UNICODE_MAP,
+    '%': r'\%',
+    '&': r'\&',
+    '#': r'\#',
+    '_': r'\_',
+}
+
+# Every map key is a single codepoint, so the substitutions compile to
+# str.translate tables - one C-level pass, no per-match Python callback
+_ESCAPE_TRANS = str.maketrans(_ESCAPE_MAP)
+_CMD_CONTENT_TRANS = str.maketrans(_CMD_CONTENT_MAP)
+
+# One pattern for the whole escape: a token is either a valid LaTeX
+# command (groups 1+2, preserved with its content escaped) or a single
+# escapable character (group 3, mapped). Matching both in the same scan
+# removes the protect/placeholder/restore phases entirely.
+_COMBINED_RE = re.compile(
+    _LATEX_CMD_RE.pattern
+    + '|('
+    + '|'.join(re.escape(k) for k in sorted(_ESCAPE_MAP, key=len, reverse=True))
+    + ')'
+)
+
+
+def _escape_token(match: "re.Match[str]") -> str:
+    """Replacement callback for _COMBINED_RE."""
+    cmd = match.group(1)
+    if cmd is not None:
+        return cmd + '{' + match.group(2).translate(_CMD_CONTENT_TRANS) + '}'
+    return _ESCAPE_MAP[match.group(3)]
+
+
+# Warnings in the .log that genuinely require a second pdflatex pass
+_RERUN_RE = re.compile(rb"Rerun to get|Label\(s\) may have changed")
+
+# Diagnostics that blame the precompiled .fmt itself (corrupt dump,
+# engine mismatch, missing file) rather than the document being compiled
+_FORMAT_ERROR_RE = re.compile(
+    r"[Ff]atal format file error"
+    r"|format file .*(?:doesn't match|was written by)"
+    r"|can't find the format file"
+)
+
+# Streamed-stdout equivalents of the .log probes: nonstopmode echoes
+# both the rerun warnings and the final "Output written" line to the
+# terminal, so a successful full compile needs no log read at all
+_OUTPUT_WRITTEN_STDOUT_RE = re.compile(r"Output written on .*? \((\d+) pages?")
+_RERUN_STDOUT_RE = re.compile(r"Rerun to get|Label\(s\) may have changed")
+
+# Per-page shipout markers ("[1]", "[2]") as they appear on the
+# terminal in nonstopmode; used to abort probes at a page boundary
+_SHIPOUT_STDOUT_RE = re.compile(r"\[(\d+)[\]{ ]")
+
+# How much pdflatex stdout to retain for error reporting
+_STDOUT_TAIL_LINES = 100
+
+# Page-tree root written near the end of pdflatex output: a dict with
+# /Type /Pages and /Count N in either order. Anchoring on /Type /Pages
+# avoids matching the /Count of hyperref's bookmark outlines.
+_PAGES_COUNT_RE = re.compile(
+    rb"/Type\s*/Pages\b[^>]*/Count\s+(\d+)|/Count\s+(\d+)[^>]*/Type\s*/Pages\b"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_latex() -> bool:
+    """Check the PATH for pdflatex once per process."""
+    return shutil.which("pdflatex") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_tectonic() -> bool:
+    """Check the PATH for tectonic once per process."""
+    return shutil.which("tectonic") is not None
+
+
 class LaTeXService:
     """Service for rendering LaTeX templates and compiling PDFs."""
 
+    # Job name for the precompiled preamble format (.fmt) file
+    PREAMBLE_FORMAT_JOB = "resume_preamble"
+
+    # Max memoized compile results (keyed by rendered-source hash)
+    COMPILE_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize the LaTeX service."""
         self.settings = get_settings()
@@ -28,21 +161,83 @@ class LaTeXService:
         self.generated_dir = self.output_dir / "generated"
         self.pdfs_dir = self.output_dir / "pdfs"
 
+        # Precompiled preamble format state (built lazily on first compile)
+        self._format_path: Optional[Path] = None
+        self._format_preamble: Optional[str] = None
+        self._format_failed = False
+
+        # Page count of the last full compile, parsed from the .log
+        self._last_page_count: Optional[int] = None
+
+        # Facts gleaned from the last pdflatex run's streamed stdout
+        self._stream_page_count: Optional[int] = None
+        self._stream_rerun = False
+        self._stream_aborted = False
+
+        # LRU of compile results keyed by a hash of the rendered tex.
+        # Identical source always typesets identically, so repeat
+        # compiles (a no-op Claude reduction, check_page_count followed
+        # by optimization) are answered without invoking the TeX engine.
+        self._compile_cache: OrderedDict[str, tuple[Optional[Path], int]] = OrderedDict()
+
+        # Last (data, rendered tex) pair. Reductions always produce new
+        # ResumeData instances, so identity is a safe staleness check,
+        # and callers that render the same object twice (page check then
+        # optimization) skip the second template pass.
+        self._render_memo: Optional[tuple[ResumeData, str]] = None
+
         # Ensure output directories exist
         self.generated_dir.mkdir(parents=True, exist_ok=True)
         self.pdfs_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up Jinja2 environment
+        # All pdflatex intermediates (.aux/.log/.out/draft PDFs) go to a
+        # session-scoped temp dir so iterating never syncs scratch files
+        # to the project's output directory; only final artifacts are
+        # copied out. On Linux, /dev/shm is guaranteed RAM-backed while
+        # /tmp may be a real disk, so prefer it when present - the
+        # PDF-move and export paths already handle crossing filesystems.
+        work_parent = None
+        shm = Path("/dev/shm")
+        if shm.is_dir():
+            work_parent = str(shm)
+        try:
+            self.work_dir = Path(tempfile.mkdtemp(prefix="resume_tex_", dir=work_parent))
+        except OSError:
+            self.work_dir = Path(tempfile.mkdtemp(prefix="resume_tex_"))
+        self._work_dir_cleanup = weakref.finalize(
+            self, shutil.rmtree, str(self.work_dir), ignore_errors=True
+        )
+
+        # Persist compiled template bytecode across processes so each
+        # CLI invocation skips re-parsing the template from source
+        bytecode_cache = None
+        try:
+            jinja_cache_dir = self.settings.cache_dir / "jinja"
+            jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
+        except OSError:
+            pass
+
+        # Set up Jinja2 environment. Templates never change at runtime,
+        # so disable the per-render stat() check and keep every compiled
+        # template in memory.
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
             trim_blocks=True,
             lstrip_blocks=True,
-            autoescape=False  # LaTeX has its own escaping rules
+            autoescape=False,  # LaTeX has its own escaping rules
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache
         )
 
         # Add custom LaTeX escape filter
         self.env.filters['latex_escape'] = self._latex_escape
 
+        # The template name never varies, so skip the per-render
+        # environment lookup and hold the compiled template directly
+        self._template = self.env.get_template("jake_resume.tex.j2")
+
     @staticmethod
     def _latex_escape(text: str) -> str:
         """
@@ -57,121 +252,50 @@ class LaTeXService:
         if not isinstance(text, str):
             return text
 
-        # Step 1: Protect valid LaTeX commands by temporarily replacing them
-        # This includes \textbf{...}, \textit{...}, etc.
-        # But first, we need to escape special chars inside the commands
-
-        # Find and temporarily replace LaTeX commands
-        latex_commands = []
-        # Use a placeholder with only alphanumeric chars that won't be affected by escaping
-        # Format: XLATEXPROTECTX followed by index followed by XLATEXPROTECTX
-        def get_placeholder(idx):
-            return f"XLATEXPROTECTX{idx}XLATEXPROTECTX"
-
-        # Pattern to match \textbf{...}, \textit{...}, etc. with optional space before brace
-        # This handles both \textbf{text} and \textbf {text}
-        latex_cmd_pattern = r'(\\text(?:bf|it|tt|sc|sl|em))\s*\{([^}]*)\}'
-
-        def protect_command(match):
-            idx = len(latex_commands)
-            cmd_name = match.group(1)  # e.g., \textbf
-            content = match.group(2)    # e.g., ≈25%
-
-            # First, handle Unicode characters in the content
-            unicode_replacements = {
-                '≈': r'$\approx$',
-                '±': r'$\pm$',
-                '×': r'$\times$',
-                '÷': r'$\div$',
-                '≤': r'$\leq$',
-                '≥': r'$\geq$',
-                '≠': r'$\neq$',
-                '→': r'$\rightarrow$',
-                '←': r'$\leftarrow$',
-                '−': r'$-$',
-                '–': r'--',
-                '—': r'---',
-                '"': r'``',
-                '"': r"''",
-                ''': r'`',
-                ''': r"'",
-                '…': r'\ldots{}',
-            }
-            for char, replacement in unicode_replacements.items():
-                content = content.replace(char, replacement)
-
-            # Then escape special LaTeX characters in the content
-            # Note: We skip '$' because Unicode replacements use it for math mode
-            # Also, we need to be careful not to double-escape already escaped characters
-            replacements_dict = {
-                '%': r'\%',
-                '&': r'\&',
-                '#': r'\#',
-                '_': r'\_'
-            }
-            for char, escaped in replacements_dict.items():
-                # Only replace if not already escaped
-                content = content.replace(char, escaped)
-
-            # Reconstruct the command with escaped content
-            # Use string concatenation to avoid any f-string escape issues
-            cmd = cmd_name + '{' + content + '}'
-            latex_commands.append(cmd)
-            return get_placeholder(idx)
-
-        text = re.sub(latex_cmd_pattern, protect_command, text)
-
-        # Step 2: Handle common Unicode characters first (before escaping special chars)
-        unicode_replacements = {
-            '≈': r'$\approx$',  # Approximately equal
-            '±': r'$\pm$',      # Plus-minus
-            '×': r'$\times$',   # Multiplication
-            '÷': r'$\div$',     # Division
-            '≤': r'$\leq$',     # Less than or equal
-            '≥': r'$\geq$',     # Greater than or equal
-            '≠': r'$\neq$',     # Not equal
-            '→': r'$\rightarrow$',  # Right arrow
-            '←': r'$\leftarrow$',   # Left arrow
-            '−': r'$-$',        # Minus sign (different from hyphen)
-            '–': r'--',         # En dash
-            '—': r'---',        # Em dash
-            '"': r'``',         # Left double quote
-            '"': r"''",         # Right double quote
-            ''': r'`',          # Left single quote
-            ''': r"'",          # Right single quote
-            '…': r'\ldots{}',   # Ellipsis
-        }
+        # Fields without LaTeX commands - dates, names, most skills -
+        # escape in a single C-level translate pass
+        if _LATEX_CMD_RE.search(text) is None:
+            return text.translate(_ESCAPE_TRANS)
 
-        for char, replacement in unicode_replacements.items():
-            text = text.replace(char, replacement)
-
-        # Step 3: Escape special LaTeX characters
-        replacements = {
-            '\\': r'\textbackslash{}',
-            '%': r'\%',
-            '$': r'\$',
-            '&': r'\&',
-            '#': r'\#',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-            '^': r'\textasciicircum{}',
-        }
+        # Commands and escapable characters are tokenized in the same
+        # linear scan, so there is nothing to protect or restore
+        return _COMBINED_RE.sub(_escape_token, text)
 
-        # Apply replacements (backslash must be first)
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
+    def warm_up(self, resume_data: ResumeData) -> None:
+        """
+        Render once and precompile the preamble format ahead of time.
 
-        # Step 4: Restore protected LaTeX commands
-        for idx, cmd in enumerate(latex_commands):
-            text = text.replace(get_placeholder(idx), cmd)
+        Intended to run in a background thread while a Claude response
+        is still streaming, so template compilation and the .fmt dump
+        overlap network time instead of the first real compile.
 
-        return text
+        Args:
+            resume_data: Resume data to render for warm-up
+        """
+        tex_content = self.render_template(resume_data)
+        self._ensure_preamble_format(tex_content)
 
     def check_latex_installed(self) -> bool:
-        """Check if pdflatex is installed and available."""
-        return shutil.which("pdflatex") is not None
+        """Check if a usable TeX engine (tectonic or pdflatex) is available.
+
+        The probe results are memoized for the life of the process: the
+        Streamlit app calls this on every rerun (each slider change) and
+        a LaTeX install does not appear or vanish mid-session.
+        """
+        return _probe_tectonic() or _probe_latex()
+
+    @staticmethod
+    def installed_engine() -> Optional[str]:
+        """Name of the TeX engine in use ("tectonic" or "pdflatex"), or None.
+
+        Tectonic is listed first because compilation prefers it when
+        both are on the PATH.
+        """
+        if _probe_tectonic():
+            return "tectonic"
+        if _probe_latex():
+            return "pdflatex"
+        return None
 
     def render_template(self, resume_data: ResumeData) -> str:
         """
@@ -183,7 +307,8 @@ class LaTeXService:
         Returns:
             Rendered LaTeX content as string
         """
-        template = self.env.get_template("jake_resume.tex.j2")
+        if self._render_memo is not None and self._render_memo[0] is resume_data:
+            return self._render_memo[1]
 
         # Convert resume data to dict for template rendering
         context = {
@@ -194,7 +319,9 @@ class LaTeXService:
             "skills": resume_data.skills,
         }
 
-        return template.render(**context)
+        rendered = self._template.render(**context)
+        self._render_memo = (resume_data, rendered)
+        return rendered
 
     def compile_latex(self, tex_content: str, output_name: str) -> Path:
         """
@@ -210,29 +337,39 @@ class LaTeXService:
         Raises:
             LaTeXCompilationError: If compilation fails
         """
-        # Check if pdflatex is available
+        # Check if a TeX engine is available
         if not self.check_latex_installed():
             raise LaTeXCompilationError(
-                "pdflatex is not installed or not in PATH. "
+                "No TeX engine (tectonic or pdflatex) found in PATH. "
                 "Please install LaTeX (MacTeX for macOS: brew install --cask mactex)"
             )
 
         # Write .tex file
-        tex_path = self.generated_dir / f"{output_name}.tex"
+        tex_path = self.work_dir / f"{output_name}.tex"
         tex_path.write_text(tex_content, encoding="utf-8")
 
-        # Compile with pdflatex (run twice for proper formatting)
-        for run in range(2):
-            result = subprocess.run(
-                [
-                    "pdflatex",
-                    "-interaction=nonstopmode",
-                    "-output-directory", str(self.generated_dir),
-                    str(tex_path)
-                ],
-                capture_output=True,
-                text=True,
-                cwd=str(self.generated_dir)
+        if _probe_tectonic():
+            # Tectonic loads its engine once, resolves cross-references
+            # internally in a single pass, and caches support files, so
+            # the rerun and preamble-format machinery is unnecessary
+            result = self._run_tectonic(tex_path)
+            if result.returncode != 0:
+                raise LaTeXCompilationError(
+                    f"Tectonic compilation failed:\n{result.stderr}"
+                )
+            # No pdflatex log to parse; render_and_compile falls back to
+            # the cheap trailer scan of the PDF
+            self._last_page_count = None
+        else:
+            fmt = self._ensure_preamble_format(tex_content)
+
+            # Compile once; a second pass is only needed when pdflatex asks
+            # for it to resolve cross-references, which a resume without
+            # \ref/\cite/TOC never does
+            result = self._run_pdflatex(
+                tex_path,
+                ["-interaction=nonstopmode", "-halt-on-error", "-synctex=0"],
+                fmt=fmt
             )
 
             if result.returncode != 0:
@@ -242,8 +379,42 @@ class LaTeXService:
                     f"Full output:\n{result.stdout}"
                 )
 
+            # nonstopmode echoed any rerun warning to the streamed
+            # stdout; the log is only consulted when stdout carried
+            # nothing usable (page count absent)
+            log_path = self.work_dir / f"{output_name}.log"
+            rerun_needed = self._stream_rerun or (
+                self._stream_page_count is None
+                and log_path.exists()
+                and _RERUN_RE.search(log_path.read_bytes())
+            )
+            if rerun_needed:
+                result = self._run_pdflatex(
+                    tex_path,
+                    ["-interaction=nonstopmode", "-halt-on-error", "-synctex=0"],
+                    fmt=fmt
+                )
+
+                if result.returncode != 0:
+                    error_msg = self._extract_latex_error(result.stdout)
+                    raise LaTeXCompilationError(
+                        f"LaTeX compilation failed:\n{error_msg}\n\n"
+                        f"Full output:\n{result.stdout}"
+                    )
+
+            # Prefer the page count from the streamed "Output written"
+            # line; fall back to the log, then (in render_and_compile)
+            # to opening the PDF
+            if self._stream_page_count is not None:
+                self._last_page_count = self._stream_page_count
+            else:
+                try:
+                    self._last_page_count = self.pages_from_log(log_path)
+                except LaTeXCompilationError:
+                    self._last_page_count = None
+
         # Move PDF to pdfs directory
-        source_pdf = self.generated_dir / f"{output_name}.pdf"
+        source_pdf = self.work_dir / f"{output_name}.pdf"
         dest_pdf = self.pdfs_dir / f"{output_name}.pdf"
 
         if not source_pdf.exists():
@@ -251,13 +422,392 @@ class LaTeXService:
                 f"PDF was not generated at expected location: {source_pdf}"
             )
 
-        shutil.copy(source_pdf, dest_pdf)
+        try:
+            # Single rename syscall instead of a byte-for-byte copy
+            source_pdf.replace(dest_pdf)
+        except OSError:
+            # work_dir may sit on a different filesystem (tmpfs)
+            shutil.move(str(source_pdf), str(dest_pdf))
+
+        # Keep the final .tex source in the generated dir for the user;
+        # all scratch files stay in the temp work dir
+        (self.generated_dir / f"{output_name}.tex").write_text(tex_content, encoding="utf-8")
 
         # Clean up auxiliary files
         self.clean_aux_files(output_name)
 
         return dest_pdf
 
+    def _run_tectonic(self, tex_path: Path) -> subprocess.CompletedProcess:
+        """Compile a .tex file with tectonic into the work dir."""
+        return subprocess.run(
+            [
+                "tectonic", "-X", "compile",
+                "--outdir", str(self.work_dir),
+                str(tex_path)
+            ],
+            capture_output=True,
+            text=True,
+            cwd=str(self.work_dir)
+        )
+
+    def _run_pdflatex(
+        self,
+        tex_path: Path,
+        options: list[str],
+        fmt: Optional[Path] = None,
+        abort_over_page: Optional[int] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Invoke pdflatex on a .tex file, optionally with a precompiled format.
+
+        If a format-based run fails with a format-specific error (stale,
+        corrupt or mismatched .fmt), the format is marked unusable and the
+        run is retried without it; document errors are returned as-is.
+
+        Args:
+            tex_path: Path to the .tex file to compile
+            options: Extra pdflatex command-line options
+            fmt: Precompiled format path (without extension), or None
+            abort_over_page: When set, terminate pdflatex as soon as a
+                shipout marker beyond this page number appears on
+                stdout; _stream_aborted is raised and _stream_page_count
+                holds the observed (lower-bound) page number
+
+        Returns:
+            CompletedProcess from the pdflatex invocation
+        """
+        args = ["pdflatex", *options]
+        if fmt is not None:
+            args.append(f"-fmt={fmt}")
+        args += ["-output-directory", str(self.work_dir), str(tex_path)]
+
+        # Stream stdout instead of buffering the whole log: only a short
+        # tail (plus any "!" error lines that scrolled past it) is ever
+        # needed, and only on failure
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=str(self.work_dir)
+        )
+        self._stream_page_count = None
+        self._stream_rerun = False
+        self._stream_aborted = False
+
+        tail: deque = deque(maxlen=_STDOUT_TAIL_LINES)
+        error_lines: list[str] = []
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("!"):
+                error_lines.append(line)
+            elif _RERUN_STDOUT_RE.search(line):
+                self._stream_rerun = True
+            else:
+                match = _OUTPUT_WRITTEN_STDOUT_RE.search(line)
+                if match:
+                    self._stream_page_count = int(match.group(1))
+                elif abort_over_page is not None:
+                    marker = _SHIPOUT_STDOUT_RE.search(line)
+                    if marker and int(marker.group(1)) > abort_over_page:
+                        # The boundary page has shipped; the rest of the
+                        # compile can't change the caller's decision
+                        self._stream_page_count = int(marker.group(1))
+                        self._stream_aborted = True
+                        proc.terminate()
+                        break
+            tail.append(line)
+        returncode = proc.wait()
+        if self._stream_aborted:
+            # Intentional termination, not a failure
+            returncode = 0
+
+        kept = list(tail)
+        stdout = "\n".join(
+            [line for line in error_lines if line not in kept] + kept
+        )
+        result = subprocess.CompletedProcess(args, returncode, stdout=stdout, stderr="")
+
+        if result.returncode != 0 and fmt is not None:
+            # Retry without the format only when the format itself is at
+            # fault; an error in the document would fail identically on
+            # the retry, and treating it as a bad .fmt would disable
+            # preamble acceleration for the rest of the process
+            output = stdout
+            if not output.strip():
+                # batchmode writes diagnostics only to the log
+                log_path = self.work_dir / f"{tex_path.stem}.log"
+                try:
+                    output = log_path.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    output = ""
+            if _FORMAT_ERROR_RE.search(output):
+                self._format_failed = True
+                return self._run_pdflatex(
+                    tex_path, options, fmt=None, abort_over_page=abort_over_page
+                )
+
+        return result
+
+    def _ensure_preamble_format(self, tex_content: str) -> Optional[Path]:
+        """
+        Precompile the document preamble into a .fmt file for reuse.
+
+        pdflatex startup is dominated by loading the preamble packages
+        (titlesec, enumitem, hyperref, ...). Dumping them into a format
+        file once via mylatexformat lets every subsequent compile skip
+        that work, which matters most for the optimizer's repeated runs.
+
+        Args:
+            tex_content: Full rendered LaTeX source
+
+        Returns:
+            Path to the .fmt file (without extension) to pass to -fmt,
+            or None if precompilation is unavailable
+        """
+        if self._format_failed or _probe_tectonic():
+            return None
+
+        marker = r"\begin{document}"
+        idx = tex_content.find(marker)
+        if idx == -1:
+            return None
+
+        preamble = tex_content[:idx]
+
+        # Reuse the existing format while the preamble is unchanged
+        if (
+            self._format_path is not None
+            and preamble == self._format_preamble
+            and self._format_path.with_suffix(".fmt").exists()
+        ):
+            return self._format_path
+
+        fmt_file = self.work_dir / f"{self.PREAMBLE_FORMAT_JOB}.fmt"
+
+        # A format dumped by an earlier process is reused when the
+        # preamble hash matches, skipping the -ini run entirely; a
+        # preamble change produces a different hash, so stale formats
+        # are never picked up
+        digest = hashlib.sha256(preamble.encode("utf-8")).hexdigest()
+        cached_fmt = self.settings.cache_dir / "fmt" / f"{digest}.fmt"
+        if cached_fmt.exists():
+            try:
+                shutil.copyfile(cached_fmt, fmt_file)
+            except OSError:
+                pass
+            else:
+                self._format_path = self.work_dir / self.PREAMBLE_FORMAT_JOB
+                self._format_preamble = preamble
+                return self._format_path
+
+        preamble_tex = self.work_dir / f"{self.PREAMBLE_FORMAT_JOB}.tex"
+        preamble_tex.write_text(preamble + marker + "\n\\end{document}\n", encoding="utf-8")
+
+        result = subprocess.run(
+            [
+                "pdflatex",
+                "-ini",
+                "-interaction=batchmode",
+                f"-jobname={self.PREAMBLE_FORMAT_JOB}",
+                "-output-directory", str(self.work_dir),
+                "&pdflatex",
+                "mylatexformat.ltx",
+                str(preamble_tex)
+            ],
+            capture_output=True,
+            text=True,
+            cwd=str(self.work_dir)
+        )
+
+        if result.returncode != 0 or not fmt_file.exists():
+            # mylatexformat may be missing from minimal TeX installs;
+            # remember the failure so we don't retry on every compile
+            self._format_failed = True
+            return None
+
+        # Persist the dump for future processes (best effort)
+        try:
+            cached_fmt.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(fmt_file, cached_fmt)
+        except OSError:
+            pass
+
+        self._format_path = self.work_dir / self.PREAMBLE_FORMAT_JOB
+        self._format_preamble = preamble
+        return self._format_path
+
+    def compile_draft(
+        self,
+        tex_content: str,
+        output_name: str,
+        abort_over: Optional[int] = None
+    ) -> int:
+        """
+        Compile LaTeX in draft mode and return the page count.
+
+        Draft mode (-draftmode) runs the full typesetting pass but skips
+        writing the PDF, which makes it substantially cheaper than a real
+        compile. Used by the optimizer for page-count probes where only
+        the final accepted resume needs an actual PDF.
+
+        Args:
+            tex_content: LaTeX source code
+            output_name: Base name for output files (without extension)
+            abort_over: When set, stop compiling as soon as the page
+                count provably exceeds this number; the return value is
+                then a lower bound rather than an exact count. Useful
+                for probes that only ask "does it fit on N pages?".
+
+        Returns:
+            Number of pages the document would produce (a lower bound
+            when an abort_over early exit was taken)
+
+        Raises:
+            LaTeXCompilationError: If compilation fails
+        """
+        digest = self._tex_digest(tex_content)
+        cached = self._compile_cache.get(digest)
+        if cached is not None:
+            # Any prior compile of this exact source already knows the
+            # page count, so the probe is free
+            self._compile_cache.move_to_end(digest)
+            return cached[1]
+
+        if not self.check_latex_installed():
+            raise LaTeXCompilationError(
+                "No TeX engine (tectonic or pdflatex) found in PATH. "
+                "Please install LaTeX (MacTeX for macOS: brew install --cask mactex)"
+            )
+
+        tex_path = self.work_dir / f"{output_name}.tex"
+        tex_path.write_text(tex_content, encoding="utf-8")
+
+        if _probe_tectonic():
+            # Tectonic has no draft mode, but its support-file caching
+            # makes a full pass cheap; count pages from the scratch PDF
+            result = self._run_tectonic(tex_path)
+            if result.returncode != 0:
+                raise LaTeXCompilationError(
+                    f"Tectonic compilation failed:\n{result.stderr}"
+                )
+            page_count = self.count_pages(self.work_dir / f"{output_name}.pdf")
+            self.clean_aux_files(output_name)
+            self._store_compile_result(digest, None, page_count)
+            return page_count
+
+        if abort_over is not None:
+            # Shipout markers only reach stdout in nonstopmode; the
+            # abort path trades batchmode's quiet terminal for the
+            # ability to stop the moment the boundary page ships
+            options = ["-interaction=nonstopmode", "-halt-on-error", "-draftmode", "-synctex=0"]
+        else:
+            options = ["-interaction=batchmode", "-halt-on-error", "-draftmode", "-synctex=0"]
+
+        result = self._run_pdflatex(
+            tex_path,
+            options,
+            fmt=self._ensure_preamble_format(tex_content),
+            abort_over_page=abort_over
+        )
+
+        log_path = self.work_dir / f"{output_name}.log"
+
+        if self._stream_aborted:
+            # The lower bound answers the probe; inexact counts are
+            # deliberately kept out of the compile cache
+            self.clean_aux_files(output_name)
+            return self._stream_page_count
+
+        if result.returncode != 0:
+            # batchmode suppresses stdout, so errors live in the log
+            log_text = log_path.read_text(encoding="utf-8", errors="replace") if log_path.exists() else ""
+            error_msg = self._extract_latex_error(log_text)
+            raise LaTeXCompilationError(f"LaTeX compilation failed:\n{error_msg}")
+
+        page_count = self.pages_from_log(log_path)
+        self.clean_aux_files(output_name)
+        self._store_compile_result(digest, None, page_count)
+
+        return page_count
+
+    @staticmethod
+    def _tex_digest(tex_content: str) -> str:
+        """Hash rendered LaTeX source for compile-cache keys."""
+        return hashlib.blake2b(tex_content.encode("utf-8")).hexdigest()
+
+    def _store_compile_result(
+        self,
+        digest: str,
+        pdf_path: Optional[Path],
+        page_count: int
+    ) -> None:
+        """
+        Record a compile result, evicting the least recent over cap.
+
+        The PDF is snapshotted under a digest-derived name in the work
+        dir rather than referenced at its published path: every full
+        compile reuses pdfs_dir/<output_name>.pdf, so a published path
+        can be silently overwritten by a later compile of different
+        source, while a digest-named snapshot is only ever written by
+        the compile it belongs to.
+        """
+        snapshot: Optional[Path] = None
+        if pdf_path is not None:
+            snapshot = self.work_dir / f"cache_{digest}.pdf"
+            try:
+                self.export_pdf(pdf_path, snapshot)
+            except OSError:
+                snapshot = None
+        self._compile_cache[digest] = (snapshot, page_count)
+        self._compile_cache.move_to_end(digest)
+        while len(self._compile_cache) > self.COMPILE_CACHE_SIZE:
+            _, (old_snapshot, _) = self._compile_cache.popitem(last=False)
+            if old_snapshot is not None:
+                old_snapshot.unlink(missing_ok=True)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized compile results and their PDF snapshots."""
+        for snapshot, _ in self._compile_cache.values():
+            if snapshot is not None:
+                snapshot.unlink(missing_ok=True)
+        self._compile_cache.clear()
+
+    @staticmethod
+    def pages_from_log(log_path: Path) -> int:
+        """
+        Parse the page count from a pdflatex log file.
+
+        Args:
+            log_path: Path to the .log file
+
+        Returns:
+            Number of pages reported by pdflatex
+
+        Raises:
+            LaTeXCompilationError: If the page count cannot be determined
+        """
+        if not log_path.exists():
+            raise LaTeXCompilationError(f"LaTeX log not found at: {log_path}")
+
+        log_bytes = log_path.read_bytes()
+
+        # Normal case: "Output written on foo.pdf (1 page, 12345 bytes)."
+        match = re.search(rb"Output written on .*? \((\d+) pages?", log_bytes, re.DOTALL)
+        if match:
+            return int(match.group(1))
+
+        # Draft mode on some TeX distributions omits the "Output written"
+        # line; fall back to the highest shipout marker like "[1]"
+        markers = re.findall(rb"\[(\d+)[\]{]", log_bytes)
+        if markers:
+            return max(int(m) for m in markers)
+
+        raise LaTeXCompilationError(
+            f"Could not determine page count from LaTeX log: {log_path}"
+        )
+
     def _extract_latex_error(self, latex_output: str) -> str:
         """Extract the most relevant error message from LaTeX output."""
         lines = latex_output.split("\n")
@@ -286,9 +836,47 @@ class LaTeXService:
         Returns:
             Number of pages
         """
+        # Fast path: the page-tree /Count sits in the trailer region of
+        # pdflatex output, so one 4 KB read usually answers the question
+        # without pypdf parsing the xref table and object graph
+        try:
+            with open(pdf_path, "rb") as f:
+                try:
+                    f.seek(-4096, 2)
+                except OSError:
+                    f.seek(0)
+                tail = f.read()
+            match = _PAGES_COUNT_RE.search(tail)
+            if match:
+                return int(match.group(1) or match.group(2))
+        except OSError:
+            pass
+
         reader = PdfReader(str(pdf_path))
         return len(reader.pages)
 
+    @staticmethod
+    def export_pdf(pdf_path: Path, dest_path: Path) -> None:
+        """
+        Publish a compiled PDF to a destination outside the output tree.
+
+        Replaces any existing file at the destination. A hardlink moves
+        no bytes at all - just an inode bump - and the fallback
+        shutil.copyfile copies in the kernel via sendfile. The source
+        stays in place, so compile-cache entries pointing at it remain
+        valid for later runs.
+
+        Args:
+            pdf_path: Compiled PDF to publish
+            dest_path: Destination path (e.g. in the Downloads folder)
+        """
+        dest_path.unlink(missing_ok=True)
+        try:
+            os.link(pdf_path, dest_path)
+        except OSError:
+            # Cross-device link or a filesystem without hardlinks
+            shutil.copyfile(pdf_path, dest_path)
+
     def validate_one_page(self, pdf_path: Path) -> bool:
         """
         Check if PDF is exactly one page.
@@ -301,6 +889,12 @@ class LaTeXService:
         """
         return self.count_pages(pdf_path) == 1
 
+    # Scratch files a compile leaves in the work dir; .pdf is included
+    # because final PDFs are moved out before cleanup runs
+    _AUX_SUFFIXES = frozenset(
+        {".aux", ".log", ".out", ".toc", ".fdb_latexmk", ".fls", ".synctex.gz", ".pdf"}
+    )
+
     def clean_aux_files(self, output_name: str) -> None:
         """
         Remove auxiliary LaTeX files.
@@ -308,31 +902,63 @@ class LaTeXService:
         Args:
             output_name: Base name of files to clean
         """
-        extensions = [".aux", ".log", ".out", ".toc", ".fdb_latexmk", ".fls", ".synctex.gz"]
-
-        for ext in extensions:
-            file_path = self.generated_dir / f"{output_name}{ext}"
-            if file_path.exists():
-                file_path.unlink()
-
-        # Also remove PDF from generated dir (we keep it in pdfs dir)
-        pdf_in_generated = self.generated_dir / f"{output_name}.pdf"
-        if pdf_in_generated.exists():
-            pdf_in_generated.unlink()
-
-    def render_and_compile(self, resume_data: ResumeData, output_name: str) -> tuple[Path, int]:
+        # One directory iteration instead of a stat per extension
+        for path in self.work_dir.glob(f"{output_name}.*"):
+            if path.name[len(output_name):] in self._AUX_SUFFIXES:
+                path.unlink(missing_ok=True)
+
+    def render_and_compile(
+        self,
+        resume_data: ResumeData,
+        output_name: str,
+        draft: bool = False
+    ) -> tuple[Optional[Path], int]:
         """
         Render template and compile to PDF in one step.
 
         Args:
             resume_data: Resume data model
             output_name: Base name for output files
+            draft: If True, run a cheap draft-mode pass that only reports
+                the page count and produces no PDF
 
         Returns:
-            Tuple of (pdf_path, page_count)
+            Tuple of (pdf_path, page_count); pdf_path is None in draft
+            mode. Compile-cache hits are republished under the requested
+            output_name, exactly like a fresh compile.
         """
         tex_content = self.render_template(resume_data)
+
+        if draft:
+            # compile_draft consults the compile cache itself
+            page_count = self.compile_draft(tex_content, output_name)
+            return None, page_count
+
+        digest = self._tex_digest(tex_content)
+        cached = self._compile_cache.get(digest)
+        if cached is not None:
+            snapshot, page_count = cached
+            if snapshot is not None and snapshot.exists():
+                # The snapshot is digest-named and immutable, so a later
+                # compile under the same output name cannot alias it;
+                # republish it at the requested location like a fresh
+                # compile would
+                pdf_path = self.pdfs_dir / f"{output_name}.pdf"
+                self.export_pdf(snapshot, pdf_path)
+                (self.generated_dir / f"{output_name}.tex").write_text(
+                    tex_content, encoding="utf-8"
+                )
+                self._compile_cache.move_to_end(digest)
+                return pdf_path, page_count
+            # Draft-only entry or evicted snapshot: recompile and refresh
+
         pdf_path = self.compile_latex(tex_content, output_name)
-        page_count = self.count_pages(pdf_path)
 
+        # The compile already parsed the page count from the pdflatex
+        # log; only fall back to reading the PDF if that failed
+        page_count = self._last_page_count
+        if page_count is None:
+            page_count = self.count_pages(pdf_path)
+
+        self._store_compile_result(digest, pdf_path, page_count)
         return pdf_path, page_count
@@ -1,7 +1,12 @@
 """Page optimization service to ensure resume fits on exactly one page."""
+import asyncio
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import click
+import orjson
 
 from src.models.resume import ResumeData
 from src.services.claude_service import ClaudeService
@@ -13,20 +18,54 @@ class OptimizationError(Exception):
     pass
 
 
+# Service construction is not free - LaTeXService builds a Jinja
+# environment and compiles the template, ClaudeService builds HTTP
+# clients - so optimizers created without explicit services share one
+# lazily-built instance per process
+
+
+@functools.lru_cache(maxsize=1)
+def _default_latex_service() -> LaTeXService:
+    return LaTeXService()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_claude_service() -> ClaudeService:
+    return ClaudeService()
+
+
 class PageOptimizer:
     """Service for optimizing resume to fit on exactly one page."""
 
+    # Deepest heuristic reduction level for _reduce_at_level
+    MAX_REDUCTION_LEVEL = 4
+
+    # Candidates to request per suggest_content_reduction_levels call
+    CLAUDE_REDUCTION_LEVELS = 4
+
+    # Calibration for _estimate_pages: body characters one page of the
+    # Jake template absorbs, plus fixed per-entry costs (heading, dates,
+    # spacing) in character-equivalents
+    ESTIMATE_CHARS_PER_PAGE = 3800
+    ESTIMATE_ENTRY_OVERHEAD = 90
+
+    # Estimates above this many pages trigger a pre-emptive heuristic
+    # cut before the first compile
+    ESTIMATE_REDUCE_THRESHOLD = 1.5
+
     def __init__(self, latex_service: Optional[LaTeXService] = None,
                  claude_service: Optional[ClaudeService] = None):
         """
         Initialize the page optimizer.
 
         Args:
-            latex_service: LaTeX service instance (creates new if None)
-            claude_service: Claude service instance (creates new if None)
+            latex_service: LaTeX service instance (shared process-wide
+                default if None)
+            claude_service: Claude service instance (shared process-wide
+                default if None)
         """
-        self.latex_service = latex_service or LaTeXService()
-        self.claude_service = claude_service or ClaudeService()
+        self.latex_service = latex_service or _default_latex_service()
+        self.claude_service = claude_service or _default_claude_service()
 
     def optimize_to_one_page(
         self,
@@ -38,6 +77,11 @@ class PageOptimizer:
         """
         Iteratively optimize resume to fit on exactly one page.
 
+        Successful results persist across CLI invocations: an unchanged
+        input hits the on-disk cache and returns the stored PDF and data
+        without touching Claude or the TeX engine. Multi-page fallback
+        output is never cached, so a rerun retries the optimization.
+
         Args:
             resume_data: Initial resume data
             output_name: Base name for output files
@@ -50,69 +94,179 @@ class PageOptimizer:
         Raises:
             OptimizationError: If cannot optimize to one page after max iterations
         """
-        current_data = resume_data
-        iteration = 0
-
-        while iteration < max_iterations:
-            iteration += 1
+        cached = self._load_cached_result(resume_data, output_name, verbose)
+        if cached is not None:
+            return cached
 
+        optimized_data, pdf_path = self._optimize_to_one_page_uncached(
+            resume_data, output_name, max_iterations, verbose
+        )
+        # Only one-page results are worth replaying; caching the
+        # "best attempt" fallback would make every rerun hand back the
+        # over-long PDF with no warning
+        if self.latex_service.count_pages(pdf_path) == 1:
+            self._store_cached_result(resume_data, optimized_data, pdf_path)
+        return optimized_data, pdf_path
+
+    def _optimize_to_one_page_uncached(
+        self,
+        resume_data: ResumeData,
+        output_name: str,
+        max_iterations: int,
+        verbose: bool
+    ) -> tuple[ResumeData, Path]:
+        """Run the actual optimization loop behind the result cache."""
+        current_data = resume_data
+        attempt = 0
+        last_tex: Optional[str] = None
+
+        # A grossly overlong resume is knowable without typesetting:
+        # when the content estimate is far past one page, spend the
+        # first compile on an already-reduced version instead of
+        # confirming the obvious overflow
+        estimate = self._estimate_pages(current_data)
+        if estimate > self.ESTIMATE_REDUCE_THRESHOLD:
             if verbose:
-                click.echo(f"  Optimization attempt {iteration}/{max_iterations}...")
+                click.echo(
+                    f"  Content volume suggests ~{estimate:.1f} pages; "
+                    "pre-reducing before the first compile..."
+                )
+            current_data = self._reduce_at_level(current_data, 1)
 
-            # Render and compile
+        def probe(data: ResumeData) -> int:
+            """Draft-compile data and return its page count."""
+            nonlocal attempt, last_tex
+            attempt += 1
+            if verbose:
+                click.echo(f"  Optimization attempt {attempt}/{max_iterations}...")
             try:
-                pdf_path, page_count = self.latex_service.render_and_compile(
-                    current_data,
-                    f"{output_name}_attempt_{iteration}"
+                # Keep the rendered source around: on success the final
+                # compile reuses it instead of rendering again
+                last_tex = self.latex_service.render_template(data)
+                # abort_over=1: the probe only asks "fits on one page?",
+                # so the compile stops the moment page 2 ships and the
+                # returned count may be a lower bound
+                pages = self.latex_service.compile_draft(
+                    last_tex,
+                    f"{output_name}_attempt_{attempt}",
+                    abort_over=1
                 )
             except Exception as e:
                 raise OptimizationError(f"Failed to compile LaTeX: {e}")
+            if verbose:
+                click.echo(f"    Compiled with {pages} page(s)")
+            return pages
+
+        page_count = probe(current_data)
 
+        if page_count == 1:
             if verbose:
-                click.echo(f"    Generated PDF with {page_count} page(s)")
+                click.echo(click.style("  ✓ Resume fits on 1 page!", fg="green"))
+            return current_data, self._finalize_success(
+                current_data, output_name, tex_content=last_tex
+            )
+
+        if page_count < 1:
+            raise OptimizationError("Resume is empty or invalid")
 
-            # Check if we've achieved the target
-            if page_count == 1:
+        if verbose:
+            click.echo(f"    Resume is too long ({page_count} pages), reducing content...")
+
+        # One batched Claude call for mild/medium/aggressive candidates,
+        # then try them locally from least to most aggressive. The call
+        # runs in a worker thread so the mildest heuristic cut can be
+        # draft-compiled during the HTTP round-trip - its page count is
+        # then already known if Claude fails or its candidates overflow.
+        candidates: list[ResumeData] = []
+        speculative = self._reduce_at_level(current_data, 1)
+        speculative_pages: Optional[int] = None
+        speculative_tex: Optional[str] = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            levels_future = pool.submit(
+                self.claude_service.suggest_content_reduction_levels,
+                current_data,
+                current_pages=page_count,
+                target_pages=1,
+                levels=self.CLAUDE_REDUCTION_LEVELS
+            )
+            if attempt < max_iterations:
+                try:
+                    speculative_pages = probe(speculative)
+                    speculative_tex = last_tex
+                except OptimizationError:
+                    speculative_pages = None
+            try:
+                candidates = levels_future.result()
+            except Exception as e:
                 if verbose:
-                    click.echo(click.style("  ✓ Resume fits on 1 page!", fg="green"))
+                    click.echo(
+                        click.style(f"    Warning: Claude optimization failed: {e}", fg="yellow")
+                    )
 
-                # Copy to final location
-                final_pdf = self.latex_service.pdfs_dir / f"{output_name}.pdf"
-                final_pdf.write_bytes(pdf_path.read_bytes())
+        # Bisect the candidate ladder for the mildest one that fits -
+        # page counts shrink monotonically with aggressiveness, so the
+        # answer costs O(log levels) compiles
+        best_candidate: Optional[ResumeData] = None
+        best_candidate_tex: Optional[str] = None
+        c_lo, c_hi = 0, len(candidates) - 1
+        while c_lo <= c_hi and attempt < max_iterations:
+            mid = (c_lo + c_hi) // 2
+            if probe(candidates[mid]) == 1:
+                best_candidate, best_candidate_tex = candidates[mid], last_tex
+                c_hi = mid - 1
+            else:
+                c_lo = mid + 1
 
-                # Save final .tex file
-                tex_content = self.latex_service.render_template(current_data)
-                final_tex = self.latex_service.generated_dir / f"{output_name}.tex"
-                final_tex.write_text(tex_content, encoding="utf-8")
+        if best_candidate is not None:
+            if verbose:
+                click.echo(click.style("  ✓ Resume fits on 1 page!", fg="green"))
+            return best_candidate, self._finalize_success(
+                best_candidate, output_name, tex_content=best_candidate_tex
+            )
 
-                return current_data, final_pdf
+        if candidates:
+            # Every probed candidate overflowed; continue reducing from
+            # the most aggressive one rather than the original
+            current_data = candidates[-1]
 
-            elif page_count < 1:
-                raise OptimizationError("Resume is empty or invalid")
+        # Claude's candidates are all spent; fall back on the result of
+        # the speculative probe if it fit
+        if speculative_pages == 1:
+            if verbose:
+                click.echo(click.style("  ✓ Resume fits on 1 page!", fg="green"))
+            return speculative, self._finalize_success(
+                speculative, output_name, tex_content=speculative_tex
+            )
 
+        # Even the most aggressive candidate overflowed (or Claude
+        # failed) - binary-search the heuristic reduction ladder for
+        # the mildest level that fits, costing O(log levels) compiles
+        # instead of one per level
+        best_fit: Optional[ResumeData] = None
+        best_tex: Optional[str] = None
+        lo, hi = 1, self.MAX_REDUCTION_LEVEL
+        if speculative_pages is not None and current_data is resume_data:
+            # No Claude candidate was applied, so the ladder reduces the
+            # same data the speculative probe did: level 1 overflowed
+            lo = 2
+        while lo <= hi and attempt < max_iterations:
+            level = (lo + hi) // 2
+            candidate = self._reduce_at_level(current_data, level)
+            if probe(candidate) == 1:
+                best_fit, best_tex = candidate, last_tex
+                hi = level - 1  # fits; try a milder cut
             else:
-                # Too many pages - need to reduce content
-                if verbose:
-                    click.echo(f"    Resume is too long ({page_count} pages), reducing content...")
+                lo = level + 1  # still overflows; cut deeper
 
-                if iteration >= max_iterations:
-                    # Last attempt failed
-                    break
+        if best_fit is not None:
+            if verbose:
+                click.echo(click.style("  ✓ Resume fits on 1 page!", fg="green"))
+            return best_fit, self._finalize_success(
+                best_fit, output_name, tex_content=best_tex
+            )
 
-                # Use Claude to intelligently reduce content
-                try:
-                    current_data = self.claude_service.suggest_content_reduction(
-                        current_data,
-                        current_pages=page_count,
-                        target_pages=1
-                    )
-                except Exception as e:
-                    if verbose:
-                        click.echo(
-                            click.style(f"    Warning: Claude optimization failed: {e}", fg="yellow")
-                        )
-                    # Fall back to manual reduction
-                    current_data = self._manual_content_reduction(current_data)
+        # Nothing fit within the attempt budget; save the deepest cut
+        current_data = self._reduce_at_level(current_data, self.MAX_REDUCTION_LEVEL)
 
         # If we get here, we couldn't optimize to one page
         if verbose:
@@ -132,53 +286,222 @@ class PageOptimizer:
 
         return current_data, pdf_path
 
-    def _manual_content_reduction(self, resume_data: ResumeData) -> ResumeData:
+    async def optimize_to_one_page_async(
+        self,
+        resume_data: ResumeData,
+        output_name: str,
+        max_iterations: int = 5,
+        verbose: bool = True
+    ) -> tuple[ResumeData, Path]:
         """
-        Manually reduce content using heuristics.
+        Async variant of optimize_to_one_page.
+
+        Runs the sync pipeline - result cache, content estimator,
+        batched candidate ladder, bisection and the speculative
+        heuristic compile - in a worker thread so the event loop stays
+        free. The pipeline overlaps its own Claude call with a compile
+        internally, so delegating loses no concurrency while keeping
+        one implementation of the optimization strategy.
+        """
+        return await asyncio.to_thread(
+            self.optimize_to_one_page,
+            resume_data,
+            output_name,
+            max_iterations,
+            verbose
+        )
 
-        This is a fallback when Claude-based reduction fails.
+    def _finalize_success(
+        self,
+        resume_data: ResumeData,
+        output_name: str,
+        tex_content: Optional[str] = None
+    ) -> Path:
+        """
+        Run the single full (non-draft) compile for the accepted resume.
+
+        Draft-mode probes do not produce a PDF, so the winning data gets
+        exactly one real compile under the final output name, which also
+        leaves the .tex file in the generated directory.
 
         Args:
-            resume_data: Resume data to reduce
+            resume_data: The resume data that fit on one page
+            output_name: Base name for output files
+            tex_content: Already-rendered LaTeX source for resume_data,
+                reused to skip a second template render
 
         Returns:
-            Reduced resume data
+            Path to the final PDF
         """
-        # Strategy 1: Limit projects to top 2
-        if len(resume_data.projects) > 2:
-            resume_data.projects = resume_data.projects[:2]
+        if tex_content is not None:
+            return self.latex_service.compile_latex(tex_content, output_name)
+        final_pdf, _ = self.latex_service.render_and_compile(resume_data, output_name)
+        return final_pdf
+
+    def _result_cache_paths(self, resume_data: ResumeData) -> tuple[Path, Path]:
+        """Cache file locations (data JSON, PDF) for an input resume."""
+        digest = hashlib.sha256(
+            orjson.dumps(resume_data.to_dict(), option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        cache_dir = self.latex_service.settings.cache_dir / "optimized"
+        return cache_dir / f"{digest}.json", cache_dir / f"{digest}.pdf"
+
+    def _load_cached_result(
+        self,
+        resume_data: ResumeData,
+        output_name: str,
+        verbose: bool
+    ) -> Optional[tuple[ResumeData, Path]]:
+        """
+        Serve a previous optimization of identical input from disk.
 
-        # Strategy 2: Reduce bullets per job
-        for exp in resume_data.experience:
-            if len(exp.bullets) > 3:
-                exp.bullets = exp.bullets[:3]
+        Re-running after unrelated edits (or none) is the common CLI
+        pattern; a hit skips every Claude call and compile. The cached
+        PDF is hardlinked to the requested output name so callers see
+        the same artifact layout as a fresh run.
+        """
+        json_path, cached_pdf = self._result_cache_paths(resume_data)
+        if not (json_path.exists() and cached_pdf.exists()):
+            return None
+        try:
+            optimized_data = ResumeData.from_dict(orjson.loads(json_path.read_bytes()))
+            dest_pdf = self.latex_service.pdfs_dir / f"{output_name}.pdf"
+            self.latex_service.export_pdf(cached_pdf, dest_pdf)
+        except Exception:
+            # Corrupt or half-written entry - rebuild it from scratch
+            return None
+        if verbose:
+            click.echo(
+                click.style("  ✓ Reusing previously optimized resume (cache hit)", fg="green")
+            )
+        return optimized_data, dest_pdf
+
+    def _store_cached_result(
+        self,
+        resume_data: ResumeData,
+        optimized_data: ResumeData,
+        pdf_path: Path
+    ) -> None:
+        """Persist an optimization result for future invocations (best effort)."""
+        json_path, cached_pdf = self._result_cache_paths(resume_data)
+        try:
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            self.latex_service.export_pdf(pdf_path, cached_pdf)
+            json_path.write_bytes(orjson.dumps(optimized_data.to_dict()))
+        except OSError:
+            pass
+
+    @classmethod
+    def _estimate_pages(cls, resume_data: ResumeData) -> float:
+        """
+        Cheap page estimate from content volume, no typesetting needed.
+
+        Sums the character counts of bullets, skills and education
+        details plus a fixed per-entry overhead, scaled by a calibrated
+        chars-per-page constant. Only used to pick a starting point for
+        optimization - real page counts always come from the TeX engine.
+
+        Args:
+            resume_data: Resume data to estimate
 
-        # Strategy 3: Reduce bullets per project
+        Returns:
+            Approximate number of pages the resume would produce
+        """
+        chars = 0
+        entries = 0
+        for exp in resume_data.experience:
+            chars += sum(len(b) for b in exp.bullets)
+            entries += 1
         for proj in resume_data.projects:
-            if len(proj.bullets) > 2:
-                proj.bullets = proj.bullets[:2]
+            chars += sum(len(b) for b in proj.bullets) + len(proj.technologies)
+            entries += 1
+        for edu in resume_data.education:
+            chars += len(edu.institution) + len(edu.degree)
+            chars += sum(len(info) for info in (edu.additional_info or []))
+            entries += 1
+        for category, items in resume_data.skills.items():
+            chars += len(category) + sum(len(skill) + 2 for skill in items)
+
+        chars += entries * cls.ESTIMATE_ENTRY_OVERHEAD
+        return chars / cls.ESTIMATE_CHARS_PER_PAGE
+
+    def _reduce_at_level(self, resume_data: ResumeData, level: int) -> ResumeData:
+        """
+        Apply heuristic cuts of increasing aggressiveness.
 
-        # Strategy 4: Remove GPA from older education entries (keep only the first)
-        if len(resume_data.education) > 1:
-            for edu in resume_data.education[1:]:
-                edu.gpa = None
-                edu.additional_info = None
+        Level 0 returns the data unchanged; each higher level tightens
+        the caps on projects, bullets per job and per project, and
+        education details. MAX_REDUCTION_LEVEL is the deepest cut that
+        still keeps every position listed. Monotonic by construction,
+        which is what lets the caller binary-search over levels.
 
-        return resume_data
+        Args:
+            resume_data: Resume data to reduce
+            level: Reduction level, 0..MAX_REDUCTION_LEVEL
+
+        Returns:
+            Reduced copy of the resume data (the input is not mutated)
+        """
+        if level <= 0:
+            return resume_data
+
+        # Level 1 matches the historical single-shot heuristics; deeper
+        # levels keep shrinking the same caps down to one each
+        max_projects = max(1, 3 - level)
+        max_job_bullets = max(1, 4 - level)
+        max_project_bullets = max(1, 3 - level)
+
+        # Pure slicing via model_copy: the input (which callers still
+        # hold, and which ClaudeService memoizes by identity) is never
+        # touched, and only the trimmed entries are copied at all
+        return resume_data.model_copy(update={
+            "experience": [
+                exp.model_copy(update={"bullets": exp.bullets[:max_job_bullets]})
+                for exp in resume_data.experience
+            ],
+            "projects": [
+                proj.model_copy(update={"bullets": proj.bullets[:max_project_bullets]})
+                for proj in resume_data.projects[:max_projects]
+            ],
+            # Drop GPA and extras from all but the first education entry
+            "education": [
+                edu if i == 0
+                else edu.model_copy(update={"gpa": None, "additional_info": None})
+                for i, edu in enumerate(resume_data.education)
+            ],
+        })
+
+    def _manual_content_reduction(self, resume_data: ResumeData) -> ResumeData:
+        """
+        Manually reduce content using heuristics.
+
+        This is a fallback when Claude-based reduction fails.
+
+        Args:
+            resume_data: Resume data to reduce
+
+        Returns:
+            Reduced resume data
+        """
+        return self._reduce_at_level(resume_data, 1)
 
     def check_page_count(self, resume_data: ResumeData, output_name: str) -> int:
         """
-        Compile resume and return page count without optimization.
+        Probe the resume's page count without optimization.
+
+        Runs a draft-mode compile, which typesets the document but
+        skips PDF generation - the cheapest way to learn the count.
 
         Args:
             resume_data: Resume data to check
             output_name: Base name for output files
 
         Returns:
-            Number of pages in generated PDF
+            Number of pages the resume produces
         """
         _, page_count = self.latex_service.render_and_compile(
             resume_data,
-            output_name
+            output_name,
+            draft=True
         )
         return page_count